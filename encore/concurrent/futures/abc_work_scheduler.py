@@ -7,12 +7,48 @@
 #
 import abc
 import logging
+import os
 import threading
+from concurrent.futures import CancelledError
+
+from encore.concurrent.futures.enhanced_thread_pool_executor import (
+    EnhancedThreadPoolExecutor)
 
 logger = logging.getLogger(__name__)
 
+#: Maximum number of pending operations that a completion callback runs
+#: back-to-back on the EnhancedThreadPoolExecutor worker that completed the
+#: previous operation, before handing the next one back to the executor.
+BATCH_LIMIT = 32
+
+# Per-thread flag set while registering a completion callback. A callback
+# invoked while it is set is running on the submitting thread (the future
+# was already done) rather than on the thread that ran the operation.
+_registering = threading.local()
+
+_shared_executor = None
+_shared_executor_lock = threading.Lock()
+
+
+def _get_shared_executor():
+    """ Return the executor shared by schedulers created without one.
+
+    The executor is created on first use. Since a scheduler only has one
+    operation in flight at a time, sharing the executor does not affect the
+    order in which a scheduler runs its operations.
 
-class ABCWorkScheduler(object):
+    """
+    global _shared_executor
+    with _shared_executor_lock:
+        if _shared_executor is None:
+            _shared_executor = EnhancedThreadPoolExecutor(
+                max_workers=min(32, (os.cpu_count() or 1) * 2),
+                name='SharedSchedulerExecutor',
+            )
+        return _shared_executor
+
+
+class ABCWorkScheduler(metaclass=abc.ABCMeta):
     """ An abstract class to implement various job scheduling and execution
     models using executors.
 
@@ -21,16 +57,22 @@ class ABCWorkScheduler(object):
         This is an experimental API and is subject to change.
 
     """
-    __metaclass__ = abc.ABCMeta
+    __slots__ = (
+        '_state_lock', '_running', '_has_pending', '_idle', '_shutdown',
+        'name', '_callback', '_on_done', '_executor', '_completing_thread',
+        '__weakref__',
+    )
 
     @abc.abstractmethod
-    def __init__(self, executor, name=None, callback=None):
+    def __init__(self, executor=None, name=None, callback=None):
         """ Initialize the Scheduler.
 
         Parameters
         ----------
         executor : concurrent.features.Executor
-            The executor to use for the jobs.
+            The executor to use for the jobs. If None, a thread pool shared
+            by all schedulers created without an executor is used. Pass an
+            executor explicitly if the jobs need dedicated threads.
 
         name : string
             The name of the Scheduler to be identified in the logs.
@@ -51,16 +93,32 @@ class ABCWorkScheduler(object):
         working with future callbacks.
 
         """
-        #: Condition variable to control access to shared state.
-        self._state_lock = threading.Condition(lock=threading.RLock())
-        #: Currently executing future, or None.
-        self._future = None
+        #: Lock to control access to shared state. It is not re-entrant: it
+        #: is never held while calling into the executor or into user code.
+        self._state_lock = threading.Lock()
+        #: True while an operation has been handed to the executor and has
+        #: not yet completed.
+        self._running = False
+        #: False only if no operation is pending. Set on every buffered
+        #: submission and cleared once `_get_next_operation` returns None;
+        #: subclasses may clear it as soon as their buffer is emptied.
+        self._has_pending = False
+        #: Set whenever no operation is running or pending.
+        self._idle = threading.Event()
+        self._idle.set()
         #: True if we're in the process of shutting down.
         self._shutdown = False
         if name is None:
             name = type(self).__name__
         self.name = name
         self._callback = callback
+        #: Bound completion callback, cached to avoid creating a new bound
+        #: method for every operation.
+        self._on_done = self._operation_completion_callback
+        #: Identifier of the thread running the completion callback, if any.
+        self._completing_thread = None
+        if executor is None:
+            executor = _get_shared_executor()
         self._executor = executor
 
     ###########################################################################
@@ -76,17 +134,59 @@ class ABCWorkScheduler(object):
             if self._shutdown:
                 raise RuntimeError(
                     "Cannot submit new operations after shutdown.")
-            self._add_pending_operation(operation, args, kwargs)
-            self._schedule_new()
+            if not self._running and not self._has_pending:
+                # Idle: start the operation without queueing it.
+                self._running = True
+                self._idle.clear()
+            else:
+                self._add_pending_operation(operation, args, kwargs)
+                self._has_pending = True
+                pending = self._schedule_new()
+                if pending is None:
+                    return
+                operation, args, kwargs = pending
+        self._execute(operation, args, kwargs)
+
+    def submit_many(self, jobs):
+        """
+        Schedule several operations at once.
+
+        `jobs` is an iterable of ``(operation, args, kwargs)`` tuples. The
+        operations are added to the pending operations in order under a
+        single acquisition of the scheduler's lock, as if they had all been
+        submitted while an operation was running: a collapsing scheduler
+        only keeps the last of them.
+
+        """
+        # The jobs are consumed before taking the lock, which is not
+        # re-entrant, so that they may use the scheduler or fail.
+        jobs = list(jobs)
+        with self._state_lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    "Cannot submit new operations after shutdown.")
+            add_pending_operation = self._add_pending_operation
+            for operation, args, kwargs in jobs:
+                add_pending_operation(operation, args, kwargs)
+                self._has_pending = True
+            pending = self._schedule_new()
+        if pending is not None:
+            self._execute(*pending)
 
     def wait(self):
         """
         Wait for all current and pending operations to complete.
 
+        Raises a RuntimeError if called from the callback, or from an
+        operation run by the completion callback, since the scheduler cannot
+        become idle until these return.
+
         """
-        with self._state_lock:
-            while self._future is not None:
-                self._state_lock.wait()
+        if self._completing_thread == threading.get_ident():
+            raise RuntimeError(
+                "Cannot wait for {0} from within its own callback.".format(
+                    self.name))
+        self._idle.wait()
 
     def shutdown(self):
         """
@@ -118,40 +218,149 @@ class ABCWorkScheduler(object):
         """
         Called on completion of an operation.
 
+        When called on a worker thread of the scheduler's
+        EnhancedThreadPoolExecutor, up to `BATCH_LIMIT` pending operations
+        are run directly on that thread rather than being resubmitted. This
+        includes operations submitted from the callback itself. With any
+        other executor, or on any other thread, every operation goes through
+        the executor.
+
+        """
+        previous_thread = self._completing_thread
+        self._completing_thread = threading.get_ident()
+        try:
+            self._handle_result(future)
+            if self._on_executor_worker():
+                self._operation_finished(batch=BATCH_LIMIT)
+            else:
+                self._operation_finished()
+        finally:
+            self._completing_thread = previous_thread
+
+    def _on_executor_worker(self):
+        """ Whether the current thread is a worker of the scheduler's
+        EnhancedThreadPoolExecutor, outside of callback registration.
+
+        """
+        if getattr(_registering, 'active', False):
+            # The future was already done when its callback was registered:
+            # this is the submitting thread.
+            return False
+        executor = self._executor
+        return (isinstance(executor, EnhancedThreadPoolExecutor) and
+                threading.current_thread() in executor._threads)
+
+    def _handle_result(self, future, logger=logger):
+        """
+        Pass a completed future to the callback and log any error to
+        `logger`.
+
         """
         try:
             if self._callback is not None:
                 self._callback(future)
             future.result()
+        except CancelledError:
+            # Cancellation, e.g. by an executor shutdown, is not an error.
+            logger.debug("Submitted %s job was cancelled.", self.name)
         except Exception as e:
-            exc_type = type(e)
             logger.exception(
-                "{0} occurred in submitted {1} job.".format(
-                    exc_type.__name__,
-                    self.name,
-                )
-            )
-            logger.error('Actual error:\n{}'.format(future.traceback()))
+                "%s occurred in submitted %s job.",
+                type(e).__name__, self.name)
+            # Futures from other executors may not provide the traceback.
+            if (logger.isEnabledFor(logging.ERROR) and
+                    hasattr(future, 'traceback')):
+                logger.error('Actual error:\n%s', future.traceback())
 
-        with self._state_lock:
-            self._future = None
-            self._schedule_new()
-            self._state_lock.notify_all()
+    def _operation_finished(self, batch=0):
+        """ Release the executor and schedule the next pending operation.
+
+        Up to `batch` pending operations are run on the current thread
+        before falling back to submitting to the executor. A non-zero
+        `batch` is only valid on a worker of an EnhancedThreadPoolExecutor.
+
+        """
+        while True:
+            with self._state_lock:
+                self._running = False
+                pending = self._schedule_new()
+            if pending is None:
+                return
+            if batch <= 0 or self._executor._shutdown:
+                # A shut down executor rejects the operation.
+                self._execute(*pending)
+                return
+            batch -= 1
+            self._handle_result(self._run_inline(*pending))
 
     def _schedule_new(self):
-        """ Schedule a new operation as dictated by the implemented scheduling
-        model.
+        """ Claim the executor for a new operation as dictated by the
+        implemented scheduling model.
+
+        Must be called with the state lock held. Returns the claimed
+        ``(operation, args, kwargs)`` tuple, whose items must then be passed
+        to `_execute` once the lock has been released, or None if no
+        operation should be started.
 
         """
-        if self._future is not None:
-            return
+        if self._running:
+            return None
+
+        if self._has_pending:
+            pending = self._get_next_operation()
+        else:
+            pending = None
+        if pending is None:
+            self._has_pending = False
+            self._idle.set()
+        else:
+            self._running = True
+            self._idle.clear()
+        return pending
+
+    def _execute(self, operation, args, kwargs):
+        """ Hand an operation claimed by `_schedule_new` to the executor.
+
+        Must be called without holding the state lock, since the executor
+        may run the operation and its completion callback synchronously.
 
-        pending = self._get_next_operation()
-        if pending is not None:
-            operation, args, kwargs = pending
-            self._future = self._executor.submit(operation, *args, **kwargs)
-            self._future.add_done_callback(
-                self._operation_completion_callback)
+        """
+        try:
+            future = self._executor.submit(operation, *args, **kwargs)
+        except BaseException:
+            with self._state_lock:
+                # The pending operations would be rejected in the same way,
+                # and leaving them would keep the scheduler from becoming
+                # idle, so they are dropped.
+                while self._get_next_operation() is not None:
+                    pass
+                self._has_pending = False
+                self._running = False
+                self._idle.set()
+            raise
+        # The callback may itself submit to another scheduler, so the flag
+        # is restored rather than cleared.
+        previous = getattr(_registering, 'active', False)
+        _registering.active = True
+        try:
+            future.add_done_callback(self._on_done)
+        finally:
+            _registering.active = previous
+
+    def _run_inline(self, operation, args, kwargs):
+        """ Run an operation claimed by `_schedule_new` on the current thread
+        and return a completed future for it.
+
+        """
+        future = self._executor._future_factory()
+        future.set_running_or_notify_cancel()
+        try:
+            result = operation(*args, **kwargs)
+        except BaseException as e:
+            future.set_exception(e)
+        else:
+            future.set_result(result)
+        return future
 
     @abc.abstractmethod
     def _add_pending_operation(self, operation, args, kwargs):
@@ -0,0 +1,145 @@
+#
+# (C) Copyright 2011-2022 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+# This file is open source software distributed according to the terms in
+# LICENSE.txt
+#
+import asyncio
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncAsynchronizer(object):
+    """ A 'forgetful' scheduling of coroutines on an asyncio event loop.
+
+    The AsyncAsynchronizer provides the same guarantees as the
+    :class:`~encore.concurrent.futures.asynchronizer.Asynchronizer`, but
+    runs coroutines as tasks on an event loop instead of running callables
+    on an executor.  At most a single operation runs at a time.  Requests to
+    `submit` a new operation while an operation is running are stored for
+    future execution, with each new submission overwriting the prior, and
+    the coroutine of an overwritten submission is never created.  The last
+    operation submitted is guaranteed to eventually be executed.
+
+    All methods must be called from the thread running the event loop.
+
+    .. warning::
+
+        This is an experimental API and is subject to change.
+
+    """
+    __slots__ = (
+        'name', '_callback', '_on_done', '_loop', '_task',
+        '_pending_operation', '_shutdown', '__weakref__',
+    )
+
+    def __init__(self, name=None, callback=None, loop=None):
+        """ Initialize the AsyncAsynchronizer.
+
+        Parameters
+        ----------
+        name : string
+            The name of the AsyncAsynchronizer to be identified in the logs.
+
+        callback : callable
+            If a callable `callback` is provided, it will be called whenever
+            an execution completes.  The callback must accept as its only
+            argument the Task that encapsulates the job.  Exceptions raised
+            within the callback will be logged and suppressed.
+
+        loop : asyncio.AbstractEventLoop
+            The event loop to run the operations on.  If not given, the
+            current event loop at the time of submission is used.
+
+        """
+        if name is None:
+            name = type(self).__name__
+        self.name = name
+        self._callback = callback
+        #: Bound completion callback, cached to avoid creating a new bound
+        #: method for every operation.
+        self._on_done = self._operation_completion_callback
+        self._loop = loop
+        #: Currently running task, or None.
+        self._task = None
+        #: Either a tuple (operation, args, kwargs) representing a pending
+        #: call, or None.
+        self._pending_operation = None
+        #: True if we're in the process of shutting down.
+        self._shutdown = False
+
+    ###########################################################################
+    # Public methods.
+    ###########################################################################
+
+    def submit(self, operation, *args, **kwargs):
+        """
+        Schedule an operation.
+
+        `operation` must be a coroutine function: the coroutine
+        ``operation(*args, **kwargs)`` is only created when the operation is
+        started.
+
+        """
+        if self._shutdown:
+            raise RuntimeError(
+                "Cannot submit new operations after shutdown.")
+        if self._task is None:
+            self._start(operation, args, kwargs)
+        else:
+            self._pending_operation = operation, args, kwargs
+
+    async def wait(self):
+        """
+        Wait for all current and pending operations to complete.
+
+        """
+        while self._task is not None:
+            # asyncio.wait neither raises the task's exception nor cancels
+            # the task if the waiter is cancelled.
+            await asyncio.wait([self._task])
+
+    async def shutdown(self):
+        """
+        Clean up and wait for pending operations.
+
+        When the coroutine returns, all pending operations have completed.
+
+        """
+        self._shutdown = True
+        await self.wait()
+
+    ###########################################################################
+    # Private methods.
+    ###########################################################################
+
+    def _start(self, operation, args, kwargs):
+        loop = self._loop
+        if loop is None:
+            loop = asyncio.get_event_loop()
+        self._task = loop.create_task(operation(*args, **kwargs))
+        self._task.add_done_callback(self._on_done)
+
+    def _operation_completion_callback(self, task):
+        """
+        Called on completion of an operation.
+
+        """
+        try:
+            if self._callback is not None:
+                self._callback(task)
+            task.result()
+        except asyncio.CancelledError:
+            pass
+        except Exception as e:
+            logger.exception(
+                "%s occurred in submitted %s job.",
+                type(e).__name__, self.name)
+
+        self._task = None
+        pending = self._pending_operation
+        if pending is not None:
+            self._pending_operation = None
+            self._start(*pending)
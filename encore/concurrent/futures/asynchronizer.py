@@ -28,14 +28,17 @@ class Asynchronizer(ABCWorkScheduler):
         This is an experimental API and is subject to change.
 
     """
+    __slots__ = ('_pending_operation', '_pending_args', '_pending_kwargs')
 
-    def __init__(self, executor, name=None, callback=None):
+    def __init__(self, executor=None, name=None, callback=None):
         """ Initialize the Asynchronizer.
 
         Parameters
         ----------
         executor : concurrent.features.Executor
-            The executor to use for the jobs.
+            The executor to use for the jobs. If None, a thread pool shared
+            by all schedulers created without an executor is used. Pass an
+            executor explicitly if the jobs need dedicated threads.
 
         name : string
             The name of the Scheduler to be identified in the logs.
@@ -57,9 +60,12 @@ class Asynchronizer(ABCWorkScheduler):
 
         """
         super(Asynchronizer, self).__init__(executor, name, callback)
-        #: Either a tuple (operation, args, kwargs) representing a pending
-        #: call, or None.
+        #: The operation of the pending call, or None. Its arguments are
+        #: stored separately to avoid building a tuple for every submission
+        #: that gets overwritten.
         self._pending_operation = None
+        self._pending_args = None
+        self._pending_kwargs = None
 
     ###########################################################################
     # Private methods.
@@ -69,12 +75,20 @@ class Asynchronizer(ABCWorkScheduler):
         """ Return the next operation to schedule or None.
 
         """
-        pending = self._pending_operation
+        operation = self._pending_operation
+        if operation is None:
+            return None
+        pending = operation, self._pending_args, self._pending_kwargs
         self._pending_operation = None
+        self._pending_args = None
+        self._pending_kwargs = None
+        self._has_pending = False
         return pending
 
     def _add_pending_operation(self, operation, args, kwargs):
         """ Add a new pending operation for scheduling.
 
         """
-        self._pending_operation = operation, args, kwargs
+        self._pending_operation = operation
+        self._pending_args = args
+        self._pending_kwargs = kwargs
@@ -5,13 +5,77 @@
 # This file is open source software distributed according to the terms in
 # LICENSE.txt
 #
+import heapq
+import itertools
 import logging
 import threading
+import time
+import weakref
 
 from .asynchronizer import Asynchronizer
 
 logger = logging.getLogger(__name__)
 
+#: Delays in progress, as a heap of ``(deadline, sequence, reference)``
+#: entries, where the deadline is on the `time.monotonic` clock and the
+#: reference is a weak reference to the delayed asynchronizer.
+_delays = []
+#: Condition guarding the delays, notified when an earlier delay is added.
+_delays_condition = threading.Condition(threading.Lock())
+#: Tie-breaker keeping the delays with equal deadlines in order.
+_delay_sequence = itertools.count()
+#: Thread shared by all the delayed asynchronizers to end their delays.
+_delay_thread = None
+
+
+def _schedule_delay(asynchronizer, deadline):
+    """ End the delay of `asynchronizer` on the shared thread at `deadline`.
+
+    """
+    global _delay_thread
+    with _delays_condition:
+        sequence = next(_delay_sequence)
+        heapq.heappush(
+            _delays, (deadline, sequence, weakref.ref(asynchronizer)))
+        if _delay_thread is None:
+            _delay_thread = threading.Thread(
+                target=_delay_loop, name='DelayedAsynchronizerDelay')
+            _delay_thread.daemon = True
+            _delay_thread.start()
+        elif _delays[0][1] == sequence:
+            # The new delay ends first: wake the thread to wait for it.
+            _delays_condition.notify()
+
+
+def _delay_loop():
+    """ End the delays of the delayed asynchronizers as they expire.
+
+    The delays only hold weak references, so that an asynchronizer can be
+    collected during its delay.
+
+    """
+    while True:
+        with _delays_condition:
+            while True:
+                if not _delays:
+                    _delays_condition.wait()
+                    continue
+                remaining = _delays[0][0] - time.monotonic()
+                if remaining <= 0:
+                    break
+                _delays_condition.wait(remaining)
+            reference = heapq.heappop(_delays)[2]
+        asynchronizer = reference()
+        if asynchronizer is None:
+            continue
+        try:
+            asynchronizer._timer_callback()
+        except Exception:
+            # The thread is shared, so the error must not end it.
+            logger.exception(
+                "Failed to end the delay of %s.", asynchronizer.name)
+        del asynchronizer
+
 
 class DelayedAsynchronizer(Asynchronizer):
     """A 'forgetful' scheduling of operations which enforces a delay
@@ -28,18 +92,24 @@ class DelayedAsynchronizer(Asynchronizer):
     asynchronizer is shut down before the timer completes.
 
     """
+    __slots__ = (
+        '_timer_factory', '_timer', '_on_timer', '_interval', '_delaying',
+    )
 
-    def __init__(self, executor, interval, name=None, callback=None,
+    def __init__(self, executor=None, *, interval, name=None, callback=None,
                  timer_factory=None):
         """Initialize the Asynchronizer.
 
         Parameters
         ----------
         executor : concurrent.features.Executor
-            The executor to use for the jobs.
+            The executor to use for the jobs. If None, a thread pool shared
+            by all schedulers created without an executor is used. Pass an
+            executor explicitly if the jobs need dedicated threads.
 
         interval : float
-            Interval between operations in seconds.
+            Interval between operations in seconds. It must be given by
+            keyword.
 
         name : string, optional
             The name of the Scheduler to be identified in the logs.
@@ -59,6 +129,9 @@ class DelayedAsynchronizer(Asynchronizer):
             and a callback to be executed on timeout.  The returned
             timer must have ``start()`` method to start the timer and a
             ``cancel()`` method to cancel the current timer at shutdown.
+            If no factory is given, the delays are run on a single thread
+            shared by all the delayed asynchronizers instead of a new timer
+            thread per operation.
 
         Notes
         -----
@@ -69,41 +142,45 @@ class DelayedAsynchronizer(Asynchronizer):
         """
         super(DelayedAsynchronizer, self).__init__(
             executor, name=name, callback=callback)
-        if timer_factory is None:
-            timer_factory = threading.Timer
         self._timer_factory = timer_factory
         self._timer = None
+        self._on_timer = self._timer_callback
         self._interval = interval
+        #: True while the delay following an operation is underway.
+        self._delaying = False
 
     def _operation_completion_callback(self, future):
         """
         Called on completion of an operation.
 
         """
+        previous_thread = self._completing_thread
+        self._completing_thread = threading.get_ident()
         try:
-            if self._callback is not None:
-                self._callback(future)
-            future.result()
-        except Exception as e:
-            exc_type = type(e)
-            logger.exception(
-                "{0} occurred in submitted {1} job.".format(
-                    exc_type.__name__,
-                    self.name,
-                )
-            )
-            logger.error('Actual error:\n{}'.format(future.traceback()))
-
+            self._handle_result(future, logger)
+        finally:
+            self._completing_thread = previous_thread
         with self._state_lock:
-            self._timer = self._timer_factory(
-                self._interval, self._timer_callback)
-            self._timer.start()
+            self._delaying = True
+            if self._timer_factory is not None:
+                self._timer = self._timer_factory(
+                    self._interval, self._on_timer)
+                self._timer.start()
+                return
+        _schedule_delay(self, time.monotonic() + self._interval)
 
     def _timer_callback(self):
         with self._state_lock:
-            self._future = None
-            self._schedule_new()
-            self._state_lock.notify_all()
+            if not self._delaying:
+                # The delay was cancelled at shutdown.
+                return
+            self._delaying = False
+            # End the delay and claim the next operation in the same
+            # critical section as the cancellation check.
+            self._running = False
+            pending = self._schedule_new()
+        if pending is not None:
+            self._execute(*pending)
 
     def _prevent_new_operations(self):
         """
@@ -115,5 +192,10 @@ class DelayedAsynchronizer(Asynchronizer):
         """
         with self._state_lock:
             self._shutdown = True
-            if self._timer is not None:
-                self._timer.cancel()
+            if self._delaying:
+                # Cancel the delay; any pending operation is not run.
+                self._delaying = False
+                if self._timer is not None:
+                    self._timer.cancel()
+                self._running = False
+                self._idle.set()
@@ -24,6 +24,8 @@ changes:
 * Optional `name` argument to prefix executor threads' names.
 * Optional `wait_on_exit` argument to let worker threads die
   abruptly during jobs on interpreter exit instead of waiting to finish.
+* Work items are passed to the workers through a `queue.SimpleQueue` where
+  available, rather than a `queue.Queue`.
 
 The implementation is largely copied to avoid reliance on undocumented, private
 parts of the code. For example, '_threads_queues' is needed to properly
@@ -33,14 +35,19 @@ in future implementations of concurrent.futures.thread.
 """
 
 import atexit
-import itertools
-import queue
 import threading
 import weakref
 import time
 
 from concurrent.futures import _base
 
+try:
+    # The C implementation takes a single internal lock per put or get.
+    from queue import SimpleQueue as _WorkQueue
+except ImportError:
+    # Python < 3.7
+    from queue import Queue as _WorkQueue
+
 from .future import Future
 
 
@@ -59,12 +66,9 @@ from .future import Future
 # threads finish.
 
 _threads_queues = weakref.WeakKeyDictionary()
-_shutdown = False
 
 
 def _python_exit():
-    global _shutdown
-    _shutdown = True
     items = list(_threads_queues.items())
     for t, q in items:
         q.put(None)
@@ -75,6 +79,8 @@ atexit.register(_python_exit)
 
 
 class _WorkItem(object):
+    __slots__ = ('future', 'fn', 'args', 'kwargs')
+
     def __init__(self, future, fn, args, kwargs):
         self.future = future
         self.fn = fn
@@ -93,7 +99,7 @@ class _WorkItem(object):
             self.future.set_result(result)
 
 
-def _worker(executor_reference, work_queue, initialize=None,
+def _worker(executor_reference, work_queue, idle_semaphore, initialize=None,
         uninitialize=None):
 
     if initialize is not None:
@@ -103,24 +109,24 @@ def _worker(executor_reference, work_queue, initialize=None,
             _base.LOGGER.critical('Initialize exception in worker',
                     exc_info=True)
 
+    # `executor_reference` is not dereferenced: the worker only keeps it
+    # alive so that its callback wakes the workers once the executor has
+    # been collected.
+    get = work_queue.get
     try:
         while True:
-            work_item = work_queue.get(block=True)
-            if work_item is not None:
-                work_item.run()
-                # Delete references to object. See issue16284
-                del work_item
-                continue
-            executor = executor_reference()
-            # Exit if:
-            #   - The interpreter is shutting down OR
-            #   - The executor that owns the worker has been collected OR
-            #   - The executor that owns the worker has been shutdown.
-            if _shutdown or executor is None or executor._shutdown:
-                # Notify other workers.
+            work_item = get(block=True)
+            if work_item is None:
+                # None is only queued when the interpreter is shutting down,
+                # or when the executor that owns the worker has been
+                # collected or shut down.  Notify other workers and exit.
                 work_queue.put(None)
                 return
-            del executor
+            work_item.run()
+            # Delete references to object. See issue16284
+            del work_item
+            # Let the executor know that this worker is available.
+            idle_semaphore.release()
     except BaseException:
         _base.LOGGER.critical('Exception in worker', exc_info=True)
     finally:
@@ -167,8 +173,18 @@ class EnhancedThreadPoolExecutor(_base.Executor):
 
         """
         self._max_workers = max_workers
-        self._work_queue = queue.Queue()
-        self._threads = set()
+        self._work_queue = _WorkQueue()
+
+        # When the executor gets lost, the weakref callback will wake up
+        # the worker threads.  The callback must not reference the executor.
+        def weakref_cb(_, q=self._work_queue):
+            q.put(None)
+        self._weakref_cb = weakref_cb
+
+        self._threads = []
+        # Counts the workers that finished a job and have not been claimed by
+        # a new submission since.
+        self._idle_semaphore = threading.Semaphore(0)
         self._shutdown = False
         self._shutdown_lock = threading.Lock()
         self._initializer = initializer
@@ -177,40 +193,83 @@ class EnhancedThreadPoolExecutor(_base.Executor):
         if name is None:
             name = type(self).__name__
         self.name = name
-        self._thread_counter = itertools.count(start=1)
 
     def submit(self, fn, *args, **kwargs):
-        with self._shutdown_lock:
-            if self._shutdown:
-                raise RuntimeError('cannot schedule new futures after shutdown')
+        # The shutdown flag is only written under the lock, but is read
+        # without it here. A submission racing with shutdown() is detected
+        # once its work item has been queued.
+        if self._shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+
+        f = self._future_factory()
+        w = _WorkItem(f, fn, args, kwargs)
+
+        self._work_queue.put(w)
+        if self._shutdown and f.cancel():
+            # The work item may be queued behind the sentinel telling the
+            # workers to exit, and would then never run.
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        if len(self._threads) < self._max_workers:
+            with self._shutdown_lock:
+                if self._shutdown:
+                    # Shut down since the check above: there may be no
+                    # worker left to run the item.
+                    if f.cancel():
+                        raise RuntimeError(
+                            'cannot schedule new futures after shutdown')
+                else:
+                    self._adjust_thread_count()
+        return f
+    submit.__doc__ = _base.Executor.submit.__doc__
 
-            f = self._future_factory()
-            w = _WorkItem(f, fn, args, kwargs)
+    def _submit_many(self, fn, arg_tuples):
+        """Schedules fn(*args) for each tuple of arguments under a single
+        acquisition of the shutdown lock, and returns the list of futures.
 
-            self._work_queue.put(w)
-            self._adjust_thread_count()
-            return f
-    submit.__doc__ = _base.Executor.submit.__doc__
+        """
+        # The arguments are consumed before taking the lock: the iterables
+        # may be slow, or submit to this executor themselves.
+        arg_tuples = list(arg_tuples)
+        future_factory = self._future_factory
+        put = self._work_queue.put
+        fs = []
+        with self._shutdown_lock:
+            if self._shutdown:
+                raise RuntimeError(
+                    'cannot schedule new futures after shutdown')
+
+            for args in arg_tuples:
+                f = future_factory()
+                put(_WorkItem(f, fn, args, {}))
+                fs.append(f)
+            new_threads = min(len(fs), self._max_workers - len(self._threads))
+            for _ in range(new_threads):
+                self._adjust_thread_count()
+        return fs
 
     def _adjust_thread_count(self):
-        # When the executor gets lost, the weakref callback will wake up
-        # the worker threads.
-        def weakref_cb(_, q=self._work_queue):
-            q.put(None)
+        # Must be called with the shutdown lock held.
+        num_threads = len(self._threads)
+        if num_threads >= self._max_workers:
+            return
+        # If an idle worker will pick up the work, don't spin a new thread.
+        if self._idle_semaphore.acquire(timeout=0):
+            return
 
-        if len(self._threads) < self._max_workers:
-            thread_name = "{0}Worker-{1}".format(self.name,
-                                                 next(self._thread_counter))
-            t = threading.Thread(target=_worker, name=thread_name,
-                                 args=(weakref.ref(self, weakref_cb),
-                                       self._work_queue,
-                                       self._initializer,
-                                       self._uninitializer))
-            t.daemon = True
-            t.start()
-            self._threads.add(t)
-            if self._wait_at_exit:
-                _threads_queues[t] = self._work_queue
+        # Worker threads are never removed from the list, so its size
+        # numbers them.
+        thread_name = "{0}Worker-{1}".format(self.name, num_threads + 1)
+        t = threading.Thread(target=_worker, name=thread_name,
+                             args=(weakref.ref(self, self._weakref_cb),
+                                   self._work_queue,
+                                   self._idle_semaphore,
+                                   self._initializer,
+                                   self._uninitializer))
+        t.daemon = True
+        t.start()
+        self._threads.append(t)
+        if self._wait_at_exit:
+            _threads_queues[t] = self._work_queue
 
     def shutdown(self, wait=True):
         with self._shutdown_lock:
@@ -245,17 +304,22 @@ class EnhancedThreadPoolExecutor(_base.Executor):
         if timeout is not None:
             end_time = timeout + time.time()
 
-        fs = [self.submit(fn, *args) for args in zip(*iterables)]
+        fs = self._submit_many(fn, zip(*iterables))
 
         # Yield must be hidden in closure so that the futures are submitted
         # before the first iterator value is required.
         def result_iterator():
             try:
-                for future in fs:
+                # Futures are popped once they have a result, so that only
+                # the ones not yet consumed are cancelled.
+                fs.reverse()
+                while fs:
                     if timeout is None:
-                        yield future.result()
+                        result = fs[-1].result()
                     else:
-                        yield future.result(end_time - time.time())
+                        result = fs[-1].result(end_time - time.time())
+                    fs.pop()
+                    yield result
             finally:
                 for future in fs:
                     future.cancel()
@@ -4,16 +4,29 @@ from concurrent.futures import _base
 
 
 class Future(_base.Future):
+    # _base.Future does not define __slots__, so instances keep a __dict__;
+    # the slots only make the attributes added here cheaper to access.
+    __slots__ = ('_traceback_formatted', '_exception_traceback')
 
     def __init__(self):
         super(Future, self).__init__()
         self._traceback_formatted = None
+        # Traceback of the exception as it was set. The exception's own
+        # __traceback__ grows with the caller's frames whenever result()
+        # re-raises it.
+        self._exception_traceback = None
 
     def traceback(self):
         """Return the formatted traceback of the error that occured in the
         Executor worker, or None if no error occurred.
 
         """
+        exception = self._exception
+        if self._traceback_formatted is None and exception is not None:
+            # Formatting is deferred to the first request, as the traceback
+            # is rarely looked at.
+            self._traceback_formatted = ''.join(traceback.format_exception(
+                type(exception), exception, self._exception_traceback))
         return self._traceback_formatted
 
     def set_exception(self, exception):
@@ -23,9 +36,10 @@ class Future(_base.Future):
         """
         with self._condition:
             self._exception = exception
-            self._traceback_formatted = traceback.format_exc()
+            self._exception_traceback = exception.__traceback__
             self._state = _base.FINISHED
             for waiter in self._waiters:
                 waiter.add_exception(self)
             self._condition.notify_all()
-        self._invoke_callbacks()
+        if self._done_callbacks:
+            self._invoke_callbacks()
@@ -21,13 +21,17 @@ class Serializer(ABCWorkScheduler):
         This is an experimental API and is subject to change.
 
     """
-    def __init__(self, executor, name=None, callback=None):
+    __slots__ = ('_pending_operations',)
+
+    def __init__(self, executor=None, name=None, callback=None):
         """ Initialize the Serializer.
 
         Parameters
         ----------
         executor : concurrent.features.Executor
-            The executor to use for the jobs.
+            The executor to use for the jobs. If None, a thread pool shared
+            by all schedulers created without an executor is used. Pass an
+            executor explicitly if the jobs need dedicated threads.
 
         name : string
             The name of the Serializer to be identified in the logs.
@@ -61,6 +65,8 @@ class Serializer(ABCWorkScheduler):
 
         """
         if self._pending_operations:
-            return self._pending_operations.popleft()
+            pending = self._pending_operations.popleft()
+            self._has_pending = bool(self._pending_operations)
+            return pending
         else:
             return None
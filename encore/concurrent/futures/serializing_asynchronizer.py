@@ -5,7 +5,7 @@
 # This file is open source software distributed according to the terms in
 # LICENSE.txt
 #
-from collections import OrderedDict
+from collections import deque
 
 from encore.concurrent.futures.abc_work_scheduler import ABCWorkScheduler
 
@@ -31,15 +31,18 @@ class SerializingAsynchronizer(ABCWorkScheduler):
         This is an experimental API and is subject to change.
 
     """
+    __slots__ = ('_pending_order', '_pending_operations')
 
-    def __init__(self, executor, name=None, callback=None):
+    def __init__(self, executor=None, name=None, callback=None):
         super(SerializingAsynchronizer, self).__init__(
             executor, name, callback)
-        # Ordered dictionary containing tuples (operation, args, kwargs)
+        # Pending operations in the order they were first submitted.
+        # Operations are executed in this order.
+        self._pending_order = deque()
+        # Dictionary containing tuples (operation, args, kwargs)
         # representing pending operations.  The items are keyed by the
-        # operation. Operations are executed in the order they were
-        # entered in the dict.
-        self._pending_operations = OrderedDict()
+        # operation, which is also in `_pending_order`.
+        self._pending_operations = {}
 
     ###########################################################################
     # Private methods.
@@ -49,13 +52,16 @@ class SerializingAsynchronizer(ABCWorkScheduler):
         """ Return the next operation to schedule or None.
 
         """
-        if len(self._pending_operations) == 0:
+        if not self._pending_order:
             return None
-        _, pending = self._pending_operations.popitem(last=False)
+        pending = self._pending_operations.pop(self._pending_order.popleft())
+        self._has_pending = bool(self._pending_order)
         return pending
 
     def _add_pending_operation(self, operation, args, kwargs):
         """ Add a new pending operation for scheduling.
 
         """
+        if operation not in self._pending_operations:
+            self._pending_order.append(operation)
         self._pending_operations[operation] = operation, args, kwargs
@@ -8,24 +8,6 @@
 
 from concurrent.futures import Executor, Future
 
-class _WorkItem(object):
-    def __init__(self, future, fn, args, kwargs):
-        self.future = future
-        self.fn = fn
-        self.args = args
-        self.kwargs = kwargs
-
-    def run(self):
-        if not self.future.set_running_or_notify_cancel():
-            return
-
-        try:
-            result = self.fn(*self.args, **self.kwargs)
-        except BaseException as e:
-            self.future.set_exception(e)
-        else:
-            self.future.set_result(result)
-
 
 class SynchronousExecutor(Executor):
     """
@@ -42,12 +24,42 @@ class SynchronousExecutor(Executor):
     def submit(self, fn, *args, **kwargs):
         if self._shutdown:
             raise RuntimeError('cannot schedule new futures after shutdown')
+        # The future cannot be cancelled before it is returned, so there is
+        # no need to mark it as running.
         f = Future()
-        w = _WorkItem(f, fn, args, kwargs)
-        w.run()
+        try:
+            result = fn(*args, **kwargs)
+        except BaseException as e:
+            f.set_exception(e)
+        else:
+            f.set_result(result)
         return f
     submit.__doc__ = Executor.submit.__doc__
 
+    def map(self, fn, *iterables, **kwargs):
+        if self._shutdown:
+            raise RuntimeError('cannot schedule new futures after shutdown')
+        # Every call completes before map returns, as with submit, but the
+        # outcomes are kept without wrapping each of them in a Future.
+        outcomes = []
+        for args in zip(*iterables):
+            try:
+                outcomes.append((True, fn(*args)))
+            except BaseException as e:
+                outcomes.append((False, e))
+
+        # Yield must be hidden in closure so that the calls are made
+        # before the first iterator value is required.
+        def result_iterator():
+            outcomes.reverse()
+            while outcomes:
+                succeeded, value = outcomes.pop()
+                if not succeeded:
+                    raise value
+                yield value
+        return result_iterator()
+    map.__doc__ = Executor.map.__doc__
+
     def shutdown(self, wait=True):
         self._shutdown = True
     shutdown.__doc__ = Executor.shutdown.__doc__
@@ -0,0 +1,135 @@
+#
+# (C) Copyright 2011-2022 Enthought, Inc., Austin, TX
+# All right reserved.
+#
+# This file is open source software distributed according to the terms in
+# LICENSE.txt
+#
+import asyncio
+import contextlib
+import logging
+import unittest
+
+from encore.concurrent.futures.async_asynchronizer import AsyncAsynchronizer
+
+
+async def _worker(data, value):
+    await asyncio.sleep(0.05)
+    data.append(value)
+    return value
+
+
+async def _floordiv(a, b):
+    return a // b
+
+
+class TestHandler(logging.Handler):
+    """
+    Simple logging handler that just accumulates and stores records.
+
+    """
+    def __init__(self):
+        logging.Handler.__init__(self)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+#: Name of the logger that reports failed jobs.
+_LOGGER_NAME = 'encore.concurrent.futures.async_asynchronizer'
+
+
+@contextlib.contextmanager
+def loghandler(logger_name):
+    """
+    Log errors from a call and yield the handler.
+
+    """
+    handler = TestHandler()
+    logger = logging.getLogger(logger_name)
+    old_level = logger.level
+    logger.setLevel(logging.DEBUG)
+    old_propagate_value = logger.propagate
+    logger.propagate = False
+    logger.addHandler(handler)
+    try:
+        yield handler
+    finally:
+        logger.removeHandler(handler)
+        logger.propagate = old_propagate_value
+        logger.setLevel(old_level)
+
+
+class TestAsyncAsynchronizer(unittest.TestCase):
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        self.asynchronizer = AsyncAsynchronizer(
+            name='TestAsyncAsynchronizer',
+            loop=self.loop,
+        )
+
+    def tearDown(self):
+        self.loop.run_until_complete(self.asynchronizer.shutdown())
+        self.loop.close()
+
+    def test_events_collapsed(self):
+        numbers = []
+
+        async def _submit_all():
+            for value in range(1, 11):
+                self.asynchronizer.submit(_worker, numbers, value)
+            await self.asynchronizer.wait()
+
+        self.loop.run_until_complete(_submit_all())
+        self.assertEqual(numbers, [1, 10])
+
+    def test_callback(self):
+        callback_numbers = []
+
+        def _callback(task):
+            callback_numbers.append(task.result())
+
+        asynchronizer = AsyncAsynchronizer(
+            name='TestCallbackAsyncAsynchronizer',
+            callback=_callback,
+            loop=self.loop,
+        )
+        numbers = []
+
+        async def _submit_all():
+            for value in range(1, 11):
+                asynchronizer.submit(_worker, numbers, value)
+            await asynchronizer.shutdown()
+
+        self.loop.run_until_complete(_submit_all())
+        self.assertEqual(numbers, [1, 10])
+        self.assertEqual(callback_numbers, [1, 10])
+
+    def test_asynchronizer_name(self):
+        asynchronizer = AsyncAsynchronizer(name="Will")
+        self.assertEqual(asynchronizer.name, "Will")
+        self.assertEqual(AsyncAsynchronizer().name, "AsyncAsynchronizer")
+
+    def test_submit_after_shutdown(self):
+        self.loop.run_until_complete(self.asynchronizer.shutdown())
+        with self.assertRaises(RuntimeError):
+            self.asynchronizer.submit(_worker, [], 1)
+
+    def test_submit_bad_job(self):
+
+        async def _submit():
+            self.asynchronizer.submit(_floordiv, 1, 0)
+            await self.asynchronizer.wait()
+
+        with loghandler(_LOGGER_NAME) as handler:
+            self.loop.run_until_complete(_submit())
+
+        self.assertEqual(len(handler.records), 1)
+        exc_type, exc_value, exc_tb = handler.records[0].exc_info
+        self.assertIs(exc_type, ZeroDivisionError)
+
+
+if __name__ == '__main__':
+    unittest.main()
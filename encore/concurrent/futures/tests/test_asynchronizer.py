@@ -8,16 +8,20 @@
 import contextlib
 import logging
 import operator
-import time
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 
 from encore.concurrent.futures.asynchronizer import Asynchronizer
 from encore.concurrent.futures.enhanced_thread_pool_executor import (
     EnhancedThreadPoolExecutor)
+from encore.concurrent.futures.future import Future
+from encore.concurrent.futures.synchronous import SynchronousExecutor
 
 
-def _worker(data, value):
-    time.sleep(0.25)
+def _worker(gate, data, value):
+    # Hold the job until the test has made all its submissions.
+    gate.wait(timeout=5.0)
     data.append(value)
     return value
 
@@ -35,14 +39,18 @@ class TestHandler(logging.Handler):
         self.records.append(record)
 
 
+#: Logger used by the schedulers to report failed jobs.
+_SCHEDULER_LOGGER = logging.getLogger(
+    'encore.concurrent.futures.abc_work_scheduler')
+
+
 @contextlib.contextmanager
-def loghandler(logger_name):
+def loghandler(logger=_SCHEDULER_LOGGER):
     """
     Log errors from a call and yield the handler.
 
     """
     handler = TestHandler()
-    logger = logging.getLogger(logger_name)
     logger.setLevel(logging.DEBUG)
     old_propagate_value = logger.propagate
     logger.propagate = False
@@ -58,29 +66,45 @@ class _TestException(Exception):
     pass
 
 
+class _CancellingExecutor(object):
+    """
+    Executor whose jobs are always cancelled before they start.
+
+    """
+    def submit(self, fn, *args, **kwargs):
+        future = Future()
+        future.cancel()
+        return future
+
+
 class TestAsynchronizer(unittest.TestCase):
 
-    def setUp(self):
-        self.executor = EnhancedThreadPoolExecutor(
+    @classmethod
+    def setUpClass(cls):
+        # The executor is shared by all the tests, which only need it to
+        # run their jobs one at a time.
+        cls.executor = EnhancedThreadPoolExecutor(
             name='TestAsynchronizerExecutor',
             max_workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+        del cls.executor
+
+    def setUp(self):
         self.asynchronizer = Asynchronizer(
             name='TestAsynchronizer',
             executor=self.executor,
         )
 
     def test_events_collapsed(self):
+        gate = threading.Event()
         numbers = []
-        self.asynchronizer.submit(_worker, numbers, 1)
-        self.asynchronizer.submit(_worker, numbers, 2)
-        self.asynchronizer.submit(_worker, numbers, 3)
-        self.asynchronizer.submit(_worker, numbers, 4)
-        self.asynchronizer.submit(_worker, numbers, 5)
-        self.asynchronizer.submit(_worker, numbers, 6)
-        self.asynchronizer.submit(_worker, numbers, 7)
-        self.asynchronizer.submit(_worker, numbers, 8)
-        self.asynchronizer.submit(_worker, numbers, 9)
-        self.asynchronizer.submit(_worker, numbers, 10)
+        submit = self.asynchronizer.submit
+        for value in range(1, 11):
+            submit(_worker, gate, numbers, value)
+        gate.set()
         self.asynchronizer.wait()
         self.assertEqual(len(numbers), 2)
         self.assertEqual(numbers[0], 1)
@@ -100,17 +124,12 @@ class TestAsynchronizer(unittest.TestCase):
             callback=_callback
         )
 
+        gate = threading.Event()
         numbers = []
-        asynchronizer.submit(_worker, numbers, 1)
-        asynchronizer.submit(_worker, numbers, 2)
-        asynchronizer.submit(_worker, numbers, 3)
-        asynchronizer.submit(_worker, numbers, 4)
-        asynchronizer.submit(_worker, numbers, 5)
-        asynchronizer.submit(_worker, numbers, 6)
-        asynchronizer.submit(_worker, numbers, 7)
-        asynchronizer.submit(_worker, numbers, 8)
-        asynchronizer.submit(_worker, numbers, 9)
-        asynchronizer.submit(_worker, numbers, 10)
+        submit = asynchronizer.submit
+        for value in range(1, 11):
+            submit(_worker, gate, numbers, value)
+        gate.set()
         asynchronizer.wait()
         self.assertEqual(len(numbers), 2)
         self.assertEqual(numbers[0], 1)
@@ -120,6 +139,158 @@ class TestAsynchronizer(unittest.TestCase):
         self.assertEqual(callback_numbers[1], 10)
         asynchronizer.shutdown()
 
+    def test_submit_many(self):
+        gate = threading.Event()
+        numbers = []
+        self.asynchronizer.submit(_worker, gate, numbers, 0)
+        self.asynchronizer.submit_many(
+            (_worker, (gate, numbers, value), {}) for value in range(1, 11))
+        gate.set()
+        self.asynchronizer.wait()
+        self.assertEqual(numbers, [0, 10])
+
+        # Operations submitted together while idle are collapsed as well.
+        self.asynchronizer.submit_many(
+            (_worker, (gate, numbers, value), {}) for value in range(1, 11))
+        self.asynchronizer.wait()
+        self.assertEqual(numbers, [0, 10, 10])
+
+    def test_pending_operation_runs_on_completing_thread(self):
+        executor = EnhancedThreadPoolExecutor(max_workers=2)
+        asynchronizer = Asynchronizer(executor=executor)
+
+        def _record_thread(gate, data, value):
+            gate.wait(timeout=5.0)
+            data.append((value, threading.current_thread()))
+
+        gate = threading.Event()
+        threads = []
+        asynchronizer.submit(_record_thread, gate, threads, 1)
+        asynchronizer.submit(_record_thread, gate, threads, 2)
+        gate.set()
+        asynchronizer.wait()
+        self.assertEqual([value for value, _ in threads], [1, 2])
+        self.assertIs(threads[0][1], threads[1][1])
+        asynchronizer.shutdown()
+        executor.shutdown()
+
+    def test_pending_operation_resubmitted_to_other_executor(self):
+        submitted = []
+
+        class _CountingExecutor(ThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                submitted.append(fn)
+                return super(_CountingExecutor, self).submit(
+                    fn, *args, **kwargs)
+
+        executor = _CountingExecutor(max_workers=2)
+        asynchronizer = Asynchronizer(executor=executor)
+        gate = threading.Event()
+        numbers = []
+        asynchronizer.submit(_worker, gate, numbers, 1)
+        asynchronizer.submit(_worker, gate, numbers, 2)
+        gate.set()
+        asynchronizer.wait()
+        self.assertEqual(numbers, [1, 2])
+        # Only the executor's own workers run pending operations inline.
+        self.assertEqual(submitted, [_worker, _worker])
+        asynchronizer.shutdown()
+        executor.shutdown()
+
+    def test_nested_submit_from_registering_callback(self):
+        # The executor returns completed futures, so the completion callbacks
+        # run on the submitting thread, while registering them.
+        class _FinishingExecutor(EnhancedThreadPoolExecutor):
+            def submit(self, fn, *args, **kwargs):
+                future = super(_FinishingExecutor, self).submit(
+                    fn, *args, **kwargs)
+                future.exception()
+                return future
+
+        executor = _FinishingExecutor(max_workers=2)
+        other = Asynchronizer(executor=executor)
+        threads = {}
+
+        def _record_thread(name):
+            threads[name] = threading.current_thread()
+
+        def _first():
+            asynchronizer.submit(_record_thread, 'second')
+
+        def _callback(future):
+            if 'other' not in threads:
+                other.submit(_record_thread, 'other')
+
+        asynchronizer = Asynchronizer(executor=executor, callback=_callback)
+
+        def _outer():
+            threads['outer'] = threading.current_thread()
+            asynchronizer.submit(_first)
+
+        executor.submit(_outer)
+        asynchronizer.wait()
+        other.wait()
+        # The pending operation is submitted, not run inline on the thread
+        # that registered the callback.
+        self.assertIsNot(threads['second'], threads['outer'])
+        asynchronizer.shutdown()
+        other.shutdown()
+        executor.shutdown()
+
+    def test_submit_from_callback(self):
+        executor = EnhancedThreadPoolExecutor(max_workers=2)
+        threads = []
+
+        def _record_thread(value):
+            threads.append(threading.current_thread())
+            return value
+
+        def _callback(future):
+            value = future.result()
+            if value < 5:
+                asynchronizer.submit(_record_thread, value + 1)
+
+        asynchronizer = Asynchronizer(executor=executor, callback=_callback)
+        asynchronizer.submit(_record_thread, 1)
+        asynchronizer.wait()
+        asynchronizer.shutdown()
+        executor.shutdown()
+        self.assertEqual(len(threads), 5)
+        # Operations submitted from the callback run on the same worker.
+        self.assertEqual(len(set(threads[1:])), 1)
+
+    def test_wait_from_callback(self):
+        errors = []
+
+        def _callback(future):
+            try:
+                self.asynchronizer.wait()
+            except RuntimeError as e:
+                errors.append(e)
+
+        self.asynchronizer._callback = _callback
+        self.asynchronizer.submit(operator.add, 1, 2)
+        self.asynchronizer.wait()
+        self.assertEqual(len(errors), 1)
+
+    def test_shared_executor(self):
+        asynchronizer1 = Asynchronizer()
+        asynchronizer2 = Asynchronizer()
+        self.assertIs(asynchronizer1._executor, asynchronizer2._executor)
+
+        gate = threading.Event()
+        gate.set()
+        numbers1 = []
+        numbers2 = []
+        asynchronizer1.submit(_worker, gate, numbers1, 1)
+        asynchronizer2.submit(_worker, gate, numbers2, 2)
+        asynchronizer1.wait()
+        asynchronizer2.wait()
+        self.assertEqual(numbers1, [1])
+        self.assertEqual(numbers2, [2])
+        asynchronizer1.shutdown()
+        asynchronizer2.shutdown()
+
     def test_asynchronizer_name(self):
         asynchronizer = Asynchronizer(executor=self.executor, name="Will")
         self.assertEqual(asynchronizer.name, "Will")
@@ -132,30 +303,27 @@ class TestAsynchronizer(unittest.TestCase):
         with self.assertRaises(RuntimeError):
             self.asynchronizer.submit(lambda: None)
 
-    def test_submit_bad_job(self):
+    def test_submit_to_shutdown_executor(self):
         """
-        Submission of a job that causes an exception should succeed,
-        but we should get a logged exception as a result.
+        An executor refusing a job must not leave the asynchronizer
+        believing an operation is running.
 
         """
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
-            self.asynchronizer.submit(operator.floordiv, 1, 0)
-            self.asynchronizer.wait()
+        executor = EnhancedThreadPoolExecutor(max_workers=1)
+        asynchronizer = Asynchronizer(executor=executor)
+        executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            asynchronizer.submit(operator.add, 1, 2)
 
-        # We log two messages for each failure. The actual traceback
-        # from the worker, and the exception of where it occurred
-        # (i.e. where the result was accessed)
-        self.assertEqual(len(handler.records), 2)
-        record = handler.records[0]
-        self.assertIsNotNone(record.exc_info)
-        exc_type, exc_value, exc_tb = record.exc_info
-        self.assertIs(exc_type, ZeroDivisionError)
+        thread = threading.Thread(target=asynchronizer.wait)
+        thread.start()
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
 
-    def test_submit_bad_job_with_callback(self):
+    def test_submit_bad_job(self):
         """
         Submission of a job that causes an exception should succeed,
-        even with a (good) callback, but we should get a logged
+        with or without a (good) callback, but we should get a logged
         exception as a result.
 
         """
@@ -163,27 +331,48 @@ class TestAsynchronizer(unittest.TestCase):
         def _callback(future):
             future.result()
 
-        asynchronizer = Asynchronizer(
-            name='TestCallbackExceptionAsynchronizer',
-            executor=self.executor,
-            callback=_callback,
-        )
+        for callback in (None, _callback):
+            self.asynchronizer._callback = callback
+            with self.subTest(callback=callback), loghandler() as handler:
+                self.asynchronizer.submit(operator.floordiv, 1, 0)
+                self.asynchronizer.wait()
+
+                # We log two messages for each failure. The actual traceback
+                # from the worker, and the exception of where it occurred
+                # (i.e. where the result was accessed)
+                self.assertEqual(len(handler.records), 2)
+                record = handler.records[0]
+                self.assertIsNotNone(record.exc_info)
+                exc_type, exc_value, exc_tb = record.exc_info
+                self.assertIs(exc_type, ZeroDivisionError)
+
+    def test_submit_bad_job_synchronous_executor(self):
+        """
+        Futures without a ``traceback`` method only log the exception.
 
-        # Submit a bad job
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        """
+        asynchronizer = Asynchronizer(executor=SynchronousExecutor())
+        with loghandler() as handler:
             asynchronizer.submit(operator.floordiv, 1, 0)
             asynchronizer.wait()
 
-        # We log two messages for each failure. The actual traceback
-        # from the worker, and the exception of where it occurred
-        # (i.e. where the result was accessed)
-        self.assertEqual(len(handler.records), 2)
-        record = handler.records[0]
-        self.assertIsNotNone(record.exc_info)
-        exc_type, exc_value, exc_tb = record.exc_info
+        self.assertEqual(len(handler.records), 1)
+        exc_type, exc_value, exc_tb = handler.records[0].exc_info
         self.assertIs(exc_type, ZeroDivisionError)
+        asynchronizer.shutdown()
+
+    def test_cancelled_job(self):
+        """
+        Cancelled jobs are not logged as errors.
+
+        """
+        asynchronizer = Asynchronizer(executor=_CancellingExecutor())
+        with loghandler() as handler:
+            asynchronizer.submit(operator.add, 1, 2)
+            asynchronizer.wait()
 
+        self.assertEqual(len(handler.records), 1)
+        self.assertEqual(handler.records[0].levelno, logging.DEBUG)
         asynchronizer.shutdown()
 
     def test_submit_job_with_raising_callback(self):
@@ -203,8 +392,7 @@ class TestAsynchronizer(unittest.TestCase):
         )
 
         # Submit a good job
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler() as handler:
             asynchronizer.submit(operator.add, 1, 0)
             asynchronizer.wait()
 
@@ -218,7 +406,7 @@ class TestAsynchronizer(unittest.TestCase):
         self.assertIs(exc_type, _TestException)
 
         # Submit a bad job
-        with loghandler(logger_name) as handler:
+        with loghandler() as handler:
             asynchronizer.submit(operator.floordiv, 1, 0)
             asynchronizer.wait()
 
@@ -236,8 +424,6 @@ class TestAsynchronizer(unittest.TestCase):
     def tearDown(self):
         self.asynchronizer.shutdown()
         del self.asynchronizer
-        self.executor.shutdown()
-        del self.executor
 
 
 if __name__ == '__main__':
@@ -8,9 +8,11 @@
 import contextlib
 import logging
 import operator
+import threading
 import time
 import unittest
 
+from encore.concurrent.futures import delayed_asynchronizer
 from encore.concurrent.futures.delayed_asynchronizer import (
     DelayedAsynchronizer)
 from encore.concurrent.futures.enhanced_thread_pool_executor import (
@@ -22,6 +24,18 @@ def _worker(data, value):
     return value
 
 
+def _wait_until(predicate, timeout=5.0):
+    """
+    Poll `predicate` until it is true or `timeout` seconds have passed.
+
+    """
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError('condition not met in time')
+        time.sleep(0.001)
+
+
 class TestHandler(logging.Handler):
     """
     Simple logging handler that just accumulates and stores records.
@@ -35,6 +49,10 @@ class TestHandler(logging.Handler):
         self.records.append(record)
 
 
+#: Name of the logger that reports failed jobs.
+_LOGGER_NAME = 'encore.concurrent.futures.delayed_asynchronizer'
+
+
 @contextlib.contextmanager
 def loghandler(logger_name):
     """
@@ -60,10 +78,20 @@ class _TestException(Exception):
 
 class TestAsynchronizer(unittest.TestCase):
 
-    def setUp(self):
-        self.executor = EnhancedThreadPoolExecutor(
+    @classmethod
+    def setUpClass(cls):
+        # The executor is shared by all the tests, which only need it to
+        # run their jobs one at a time.
+        cls.executor = EnhancedThreadPoolExecutor(
             name='TestAsynchronizerExecutor',
             max_workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+        del cls.executor
+
+    def setUp(self):
         self.asynchronizer = DelayedAsynchronizer(
             name='TestAsynchronizer',
             executor=self.executor,
@@ -73,8 +101,6 @@ class TestAsynchronizer(unittest.TestCase):
     def tearDown(self):
         self.asynchronizer.shutdown()
         del self.asynchronizer
-        self.executor.shutdown()
-        del self.executor
 
     def test_events_collapsed(self):
         numbers = []
@@ -121,6 +147,37 @@ class TestAsynchronizer(unittest.TestCase):
         for difference in differences:
             self.assertGreaterEqual(difference, 0.5)
 
+    def test_shutdown_cancels_delay(self):
+        numbers = []
+        self.asynchronizer.submit(_worker, numbers, 1)
+        self.asynchronizer.submit(_worker, numbers, 2)
+        _wait_until(lambda: self.asynchronizer._delaying)
+        self.asynchronizer.shutdown()
+        self.assertFalse(self.asynchronizer._delaying)
+        # The cancelled delay still expires, but runs nothing.
+        _wait_until(lambda: not delayed_asynchronizer._delays)
+        self.assertEqual(numbers, [1])
+
+    def test_delay_thread_shared(self):
+        times = []
+
+        def _record_time(_list):
+            _list.append(time.time())
+
+        self.asynchronizer.submit(_record_time, times)
+        self.asynchronizer.wait()
+        delay_thread = delayed_asynchronizer._delay_thread
+        thread_count = threading.active_count()
+        asynchronizers = [
+            DelayedAsynchronizer(self.executor, interval=0.01) for _ in range(10)]
+        for asynchronizer in asynchronizers:
+            asynchronizer.submit(_record_time, times)
+        for asynchronizer in asynchronizers:
+            asynchronizer.shutdown()
+        self.assertIs(delayed_asynchronizer._delay_thread, delay_thread)
+        self.assertEqual(threading.active_count(), thread_count)
+        self.assertEqual(len(times), 11)
+
     def test_callback(self):
         # Make a callback that repeats the insertion into another queue.
         callback_numbers = []
@@ -167,6 +224,35 @@ class TestAsynchronizer(unittest.TestCase):
             asynchronizer._executor.name,
             'TestAsynchronizerExecutor')
 
+    def test_wait_from_callback(self):
+        errors = []
+
+        def _callback(future):
+            try:
+                self.asynchronizer.wait()
+            except RuntimeError as e:
+                errors.append(e)
+
+        self.asynchronizer._callback = _callback
+        self.asynchronizer.submit(operator.add, 1, 2)
+        self.asynchronizer.wait()
+        self.assertEqual(len(errors), 1)
+
+    def test_shared_executor(self):
+        asynchronizer = DelayedAsynchronizer(interval=0.25)
+        other = DelayedAsynchronizer(None, interval=0.25)
+        self.assertIs(asynchronizer._executor, other._executor)
+
+        numbers = []
+        asynchronizer.submit(_worker, numbers, 1)
+        asynchronizer.shutdown()
+        other.shutdown()
+        self.assertEqual(numbers, [1])
+
+    def test_interval_required(self):
+        with self.assertRaises(TypeError):
+            DelayedAsynchronizer(self.executor)
+
     def test_submit_after_shutdown(self):
         self.asynchronizer.shutdown()
         with self.assertRaises(RuntimeError):
@@ -178,8 +264,7 @@ class TestAsynchronizer(unittest.TestCase):
         but we should get a logged exception as a result.
 
         """
-        logger_name = 'encore.concurrent.futures.delayed_asynchronizer'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             self.asynchronizer.submit(operator.floordiv, 1, 0)
             self.asynchronizer.wait()
 
@@ -211,8 +296,7 @@ class TestAsynchronizer(unittest.TestCase):
         )
 
         # Submit a bad job
-        logger_name = 'encore.concurrent.futures.delayed_asynchronizer'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             asynchronizer.submit(operator.floordiv, 1, 0)
             asynchronizer.wait()
 
@@ -245,8 +329,7 @@ class TestAsynchronizer(unittest.TestCase):
         )
 
         # Submit a good job
-        logger_name = 'encore.concurrent.futures.delayed_asynchronizer'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             asynchronizer.submit(operator.add, 1, 0)
             asynchronizer.wait()
 
@@ -260,7 +343,7 @@ class TestAsynchronizer(unittest.TestCase):
         self.assertIs(exc_type, _TestException)
 
         # Submit a bad job
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             asynchronizer.submit(operator.floordiv, 1, 0)
             asynchronizer.wait()
 
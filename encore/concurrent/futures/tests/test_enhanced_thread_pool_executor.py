@@ -1,7 +1,6 @@
 # Portions of this code are taken from the Python source distribution, which is
 # subject to the PSF license. See http://docs.python.org/2/license.html.
 
-import collections
 import threading
 import time
 import unittest
@@ -29,6 +28,9 @@ CANCELLED_FUTURE = create_future(state=CANCELLED)
 CANCELLED_AND_NOTIFIED_FUTURE = create_future(state=CANCELLED_AND_NOTIFIED)
 EXCEPTION_FUTURE = create_future(state=FINISHED, exception=OSError())
 SUCCESSFUL_FUTURE = create_future(state=FINISHED, result=42)
+#: The precomputed futures that have already completed.
+TERMINAL_FUTURES = (
+    CANCELLED_AND_NOTIFIED_FUTURE, EXCEPTION_FUTURE, SUCCESSFUL_FUTURE)
 
 
 def mul(x, y):
@@ -45,7 +47,36 @@ class MyObject(object):
         pass
 
 
-class ExecutorMixin(object):
+def _prime_executor(executor, worker_count):
+    # Make sure that the executor is ready to do work before running the
+    # tests. This should reduce the probability of timeouts in the tests.
+    # The jobs only return once every worker has picked one up.
+    barrier = threading.Barrier(worker_count + 1)
+    futures_ = [executor.submit(barrier.wait) for _ in range(worker_count)]
+
+    barrier.wait()
+    for f in futures_:
+        f.result()
+
+
+class _ScopedExecutor(object):
+    """ Submit to a shared executor, keeping track of the futures.
+
+    """
+    def __init__(self, executor):
+        self._executor = executor
+        self.futures = []
+
+    def submit(self, fn, *args, **kwargs):
+        future = self._executor.submit(fn, *args, **kwargs)
+        self.futures.append(future)
+        return future
+
+
+class FreshExecutorMixin(object):
+    """ Run each test with its own executor.
+
+    """
     worker_count = 5
 
     def setUp(self):
@@ -62,16 +93,44 @@ class ExecutorMixin(object):
         self.assertLess(dt, 60, "synchronization issue: test lasted too long")
 
     def _prime_executor(self):
-        # Make sure that the executor is ready to do work before running the
-        # tests. This should reduce the probability of timeouts in the tests.
-        futures_ = [self.executor.submit(time.sleep, 0.1)
-                   for _ in range(self.worker_count)]
+        _prime_executor(self.executor, self.worker_count)
 
-        for f in futures_:
-            f.result()
 
+class SharedExecutorMixin(object):
+    """ Run all the tests of a class on one executor.
+
+    The tests must not shut the executor down.  Each test waits for the
+    jobs it submitted before the next one starts.
+
+    """
+    worker_count = 5
 
-class EnhancedThreadPoolMixin(ExecutorMixin):
+    @classmethod
+    def setUpClass(cls):
+        super(SharedExecutorMixin, cls).setUpClass()
+        cls._shared_executor = cls.executor_type(max_workers=cls.worker_count)
+        _prime_executor(cls._shared_executor, cls.worker_count)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._shared_executor.shutdown(wait=True)
+        super(SharedExecutorMixin, cls).tearDownClass()
+
+    def setUp(self):
+        self.t1 = time.time()
+        self.executor = _ScopedExecutor(self._shared_executor)
+
+    def tearDown(self):
+        futures.wait(self.executor.futures)
+        dt = time.time() - self.t1
+        self.assertLess(dt, 60, "synchronization issue: test lasted too long")
+
+
+class EnhancedThreadPoolMixin(FreshExecutorMixin):
+    executor_type = EnhancedThreadPoolExecutor
+
+
+class SharedEnhancedThreadPoolMixin(SharedExecutorMixin):
     executor_type = EnhancedThreadPoolExecutor
 
 
@@ -88,10 +147,13 @@ class EnhancedThreadPoolShutdownTest(EnhancedThreadPoolMixin, unittest.TestCase)
         pass
 
     def test_threads_terminate(self):
-        self.executor.submit(mul, 21, 2)
-        self.executor.submit(mul, 6, 7)
-        self.executor.submit(mul, 3, 14)
+        # Block the jobs, so that no idle worker can take the next one.
+        sem = threading.Semaphore(0)
+        for _ in range(3):
+            self.executor.submit(sem.acquire)
         self.assertEqual(len(self.executor._threads), 3)
+        for _ in range(3):
+            sem.release()
         self.executor.shutdown()
         for t in self.executor._threads:
             t.join()
@@ -120,6 +182,29 @@ class EnhancedThreadPoolShutdownTest(EnhancedThreadPoolMixin, unittest.TestCase)
                           self.executor.submit,
                           pow, 2, 5)
 
+    def test_shutdown_during_submit(self):
+        # Shut the executor down once submit has queued the work item, but
+        # before it starts a worker thread for it.
+        executor = self.executor
+        lock = executor._shutdown_lock
+
+        class ShutdownOnAcquire(object):
+            def __enter__(self):
+                executor._shutdown_lock = lock
+                executor.shutdown(wait=False)
+                return lock.__enter__()
+
+            def __exit__(self, *exc_info):
+                return lock.__exit__(*exc_info)
+
+        executor._shutdown_lock = ShutdownOnAcquire()
+        with self.assertRaises(RuntimeError):
+            executor.submit(pow, 2, 5)
+        self.assertEqual(executor._threads, [])
+        # No worker will run the queued item, so its future is cancelled.
+        work_item = executor._work_queue.get_nowait()
+        self.assertTrue(work_item.future.cancelled())
+
     def test_interpreter_shutdown(self):
         # Test the atexit hook for shutdown of worker threads and processes
         rc, out, err = assert_python_ok('-c', """\
@@ -146,7 +231,8 @@ if 1:
             f.result()
 
 
-class EnhancedThreadPoolWaitTests(EnhancedThreadPoolMixin, unittest.TestCase):
+class EnhancedThreadPoolWaitTests(SharedEnhancedThreadPoolMixin,
+                                  unittest.TestCase):
 
     def test_pending_calls_race(self):
         # Issue #14406: multi-threaded race condition when waiting on all
@@ -226,18 +312,11 @@ class EnhancedThreadPoolWaitTests(EnhancedThreadPoolMixin, unittest.TestCase):
         future2 = self.executor.submit(mul, 2, 21)
 
         finished, pending = futures.wait(
-                [SUCCESSFUL_FUTURE,
-                 CANCELLED_AND_NOTIFIED_FUTURE,
-                 EXCEPTION_FUTURE,
-                 future1,
-                 future2],
+                TERMINAL_FUTURES + (future1, future2),
                 return_when=futures.ALL_COMPLETED)
 
-        self.assertEqual(set([SUCCESSFUL_FUTURE,
-                              CANCELLED_AND_NOTIFIED_FUTURE,
-                              EXCEPTION_FUTURE,
-                              future1,
-                              future2]), finished)
+        self.assertEqual(set(TERMINAL_FUTURES + (future1, future2)),
+                         finished)
         self.assertEqual(set(), pending)
 
     def test_timeout(self):
@@ -245,56 +324,37 @@ class EnhancedThreadPoolWaitTests(EnhancedThreadPoolMixin, unittest.TestCase):
         future2 = self.executor.submit(time.sleep, 6)
 
         finished, pending = futures.wait(
-                [CANCELLED_AND_NOTIFIED_FUTURE,
-                 EXCEPTION_FUTURE,
-                 SUCCESSFUL_FUTURE,
-                 future1, future2],
+                TERMINAL_FUTURES + (future1, future2),
                 timeout=5,
                 return_when=futures.ALL_COMPLETED)
 
-        self.assertEqual(set([CANCELLED_AND_NOTIFIED_FUTURE,
-                              EXCEPTION_FUTURE,
-                              SUCCESSFUL_FUTURE,
-                              future1]), finished)
+        self.assertEqual(set(TERMINAL_FUTURES + (future1,)), finished)
         self.assertEqual(set([future2]), pending)
 
 
-class EnhancedThreadPoolAsCompletedTests(EnhancedThreadPoolMixin, unittest.TestCase):
+class EnhancedThreadPoolAsCompletedTests(SharedEnhancedThreadPoolMixin,
+                                         unittest.TestCase):
 
     def test_no_timeout(self):
         future1 = self.executor.submit(mul, 2, 21)
         future2 = self.executor.submit(mul, 7, 6)
 
         completed = set(futures.as_completed(
-                [CANCELLED_AND_NOTIFIED_FUTURE,
-                 EXCEPTION_FUTURE,
-                 SUCCESSFUL_FUTURE,
-                 future1, future2]))
-        self.assertEqual(set(
-                [CANCELLED_AND_NOTIFIED_FUTURE,
-                 EXCEPTION_FUTURE,
-                 SUCCESSFUL_FUTURE,
-                 future1, future2]),
-                completed)
+                TERMINAL_FUTURES + (future1, future2)))
+        self.assertEqual(set(TERMINAL_FUTURES + (future1, future2)),
+                         completed)
 
     def test_zero_timeout(self):
         future1 = self.executor.submit(time.sleep, 2)
         completed_futures = set()
         try:
             for future in futures.as_completed(
-                    [CANCELLED_AND_NOTIFIED_FUTURE,
-                     EXCEPTION_FUTURE,
-                     SUCCESSFUL_FUTURE,
-                     future1],
-                    timeout=0):
+                    TERMINAL_FUTURES + (future1,), timeout=0):
                 completed_futures.add(future)
         except futures.TimeoutError:
             pass
 
-        self.assertEqual(set([CANCELLED_AND_NOTIFIED_FUTURE,
-                              EXCEPTION_FUTURE,
-                              SUCCESSFUL_FUTURE]),
-                         completed_futures)
+        self.assertEqual(set(TERMINAL_FUTURES), completed_futures)
 
 
 class EnhancedThreadPoolExecutorTest(EnhancedThreadPoolMixin, unittest.TestCase):
@@ -310,6 +370,17 @@ class EnhancedThreadPoolExecutorTest(EnhancedThreadPoolMixin, unittest.TestCase)
         self.executor.shutdown(wait=True)
         self.assertEqual(self.finished, set(range(10)))
 
+    def test_idle_thread_reuse(self):
+        executor = EnhancedThreadPoolExecutor(max_workers=5)
+        for _ in range(10):
+            executor.submit(mul, 21, 2).result()
+            # The worker reports itself idle just after setting the result:
+            # wait for it, then leave it for the next submission.
+            self.assertTrue(executor._idle_semaphore.acquire(timeout=5.0))
+            executor._idle_semaphore.release()
+        self.assertEqual(len(executor._threads), 1)
+        executor.shutdown()
+
     def test_submit(self):
         future = self.executor.submit(pow, 2, 8)
         self.assertEqual(256, future.result())
@@ -321,7 +392,34 @@ class EnhancedThreadPoolExecutorTest(EnhancedThreadPoolMixin, unittest.TestCase)
     def test_map(self):
         self.assertEqual(
                 list(self.executor.map(pow, range(10), range(10))),
-                list(map(pow, range(10), range(10))))
+                [1, 1, 4, 27, 256, 3125, 46656, 823543, 16777216, 387420489])
+
+    def test_map_after_shutdown(self):
+        self.executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.executor.map(abs, range(-5, 5))
+
+    def test_map_generator_submitting(self):
+        # The generator submits to the executor while map consumes it. The
+        # executor has no worker yet, so submitting starts one.
+        executor = EnhancedThreadPoolExecutor(max_workers=5)
+
+        def values():
+            for value in range(5):
+                yield executor.submit(abs, -value).result()
+
+        results = []
+
+        def _map():
+            results.extend(executor.map(mul, values(), values()))
+
+        thread = threading.Thread(target=_map)
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(results, [0, 1, 4, 9, 16])
+        executor.shutdown()
 
     def test_map_exception(self):
         i = self.executor.map(divmod, [1, 1, 1, 1], [2, 3, 0, 5])
@@ -488,22 +586,17 @@ class TestCustomFuture(unittest.TestCase):
 
 def _start_all_threads(executor, num_workers):
 
-    counter = collections.Counter(count=0)
-    lock = threading.Lock()
+    barrier = threading.Barrier(num_workers)
     futures_ = []
     for i in range(num_workers):
-        future = executor.submit(
-            _wait_for_counter, counter, lock, num_workers)
+        future = executor.submit(_wait_for_counter, barrier)
         futures_.append(future)
     futures.wait(futures_)
     return futures_
 
 
-def _wait_for_counter(counter, lock, max_count):
-    with lock:
-        counter['count'] += 1
-    while counter['count'] < max_count:
-        time.sleep(0.05)
+def _wait_for_counter(barrier):
+    barrier.wait()
 
 
 if __name__ == "__main__":
@@ -8,16 +8,19 @@
 import contextlib
 import logging
 import operator
+import threading
 import time
 import unittest
 
 from encore.concurrent.futures.serializer import Serializer
 from encore.concurrent.futures.enhanced_thread_pool_executor import (
     EnhancedThreadPoolExecutor)
+from encore.concurrent.futures.synchronous import SynchronousExecutor
 
 
-def _worker(data, value):
-    time.sleep(0.1)
+def _worker(data, value, delay=0):
+    if delay:
+        time.sleep(delay)
     data.append(value)
     return value
 
@@ -35,6 +38,10 @@ class TestHandler(logging.Handler):
         self.records.append(record)
 
 
+#: Name of the logger that reports failed jobs.
+_LOGGER_NAME = 'encore.concurrent.futures.abc_work_scheduler'
+
+
 @contextlib.contextmanager
 def loghandler(logger_name):
     """
@@ -60,10 +67,20 @@ class _TestException(Exception):
 
 class TestSerializer(unittest.TestCase):
 
-    def setUp(self):
-        self.executor = EnhancedThreadPoolExecutor(
+    @classmethod
+    def setUpClass(cls):
+        # The executor is shared by all the tests, which only need it to
+        # run their jobs one at a time.
+        cls.executor = EnhancedThreadPoolExecutor(
             name='TestSerializerExecutor',
             max_workers=1)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.executor.shutdown()
+        del cls.executor
+
+    def setUp(self):
         self.serializer = Serializer(
             name='TestSerializer',
             executor=self.executor,
@@ -85,6 +102,73 @@ class TestSerializer(unittest.TestCase):
         self.assertEqual(len(numbers), 10)
         self.assertEqual(numbers, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
 
+    def test_events_serialized_on_concurrent_executor(self):
+        # Earlier jobs take longer, so any overlap would reorder them.
+        executor = EnhancedThreadPoolExecutor(
+            name='TestConcurrentSerializerExecutor',
+            max_workers=4)
+        serializer = Serializer(
+            name='TestConcurrentSerializer',
+            executor=executor,
+        )
+        numbers = []
+        for value in range(1, 6):
+            serializer.submit(_worker, numbers, value, 0.01 * (6 - value))
+        serializer.shutdown()
+        executor.shutdown()
+        self.assertEqual(numbers, [1, 2, 3, 4, 5])
+
+    def test_submit_many(self):
+        numbers = []
+        self.serializer.submit(_worker, numbers, 1)
+        self.serializer.submit_many(
+            (_worker, (numbers, value), {}) for value in range(2, 11))
+        self.serializer.wait()
+        self.assertEqual(numbers, [1, 2, 3, 4, 5, 6, 7, 8, 9, 10])
+
+        self.serializer.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.serializer.submit_many([(_worker, (numbers, 11), {})])
+
+    def test_submit_many_failing_jobs(self):
+        numbers = []
+
+        def jobs():
+            yield _worker, (numbers, 1), {}
+            raise _TestException('Failing jobs')
+
+        with self.assertRaises(_TestException):
+            self.serializer.submit_many(jobs())
+        # None of the jobs is scheduled.
+        self.assertFalse(self.serializer._has_pending)
+        self.assertFalse(self.serializer._pending_operations)
+        self.serializer.submit(_worker, numbers, 2)
+        self.serializer.wait()
+        self.assertEqual(numbers, [2])
+
+    def test_submit_many_jobs_using_serializer(self):
+        serializer = Serializer(
+            name='TestReentrantSerializer',
+            executor=self.executor,
+        )
+        numbers = []
+
+        def jobs():
+            for value in range(1, 4):
+                serializer.submit(_worker, numbers, value)
+                yield _worker, (numbers, value * 10), {}
+
+        def _submit():
+            serializer.submit_many(jobs())
+            serializer.shutdown()
+
+        thread = threading.Thread(target=_submit)
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(numbers, [1, 2, 3, 10, 20, 30])
+
     def test_callback(self):
         # Make a callback that repeats the insertion into another queue.
         callback_numbers = []
@@ -135,8 +219,7 @@ class TestSerializer(unittest.TestCase):
         but we should get a logged exception as a result.
 
         """
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             self.serializer.submit(operator.floordiv, 1, 0)
             self.serializer.wait()
 
@@ -167,8 +250,7 @@ class TestSerializer(unittest.TestCase):
         )
 
         # Submit a bad job
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             serializer.submit(operator.floordiv, 1, 0)
             serializer.wait()
 
@@ -200,8 +282,7 @@ class TestSerializer(unittest.TestCase):
         )
 
         # Submit a good job
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             serializer.submit(operator.add, 1, 0)
             serializer.wait()
 
@@ -215,7 +296,7 @@ class TestSerializer(unittest.TestCase):
         self.assertIs(exc_type, _TestException)
 
         # Submit a bad job
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             serializer.submit(operator.floordiv, 1, 0)
             serializer.wait()
 
@@ -230,11 +311,67 @@ class TestSerializer(unittest.TestCase):
 
         serializer.shutdown()
 
+    def test_synchronous_executor_resubmit(self):
+        """
+        The scheduler lock is not re-entrant, so it must not be held while
+        the executor runs an operation or its completion callback.
+
+        """
+        numbers = []
+
+        def _callback(future):
+            value = future.result()
+            numbers.append(value)
+            if value < 5:
+                serializer.submit(operator.add, value, 1)
+
+        serializer = Serializer(
+            name='TestSynchronousSerializer',
+            executor=SynchronousExecutor(),
+            callback=_callback,
+        )
+
+        def _submit():
+            serializer.submit(operator.add, 0, 1)
+            serializer.shutdown()
+
+        thread = threading.Thread(target=_submit)
+        thread.start()
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(numbers, [1, 2, 3, 4, 5])
+
+    def test_rejected_operation_drops_pending(self):
+        """
+        When the executor rejects an operation, the pending operations are
+        dropped so that the serializer still becomes idle.
+
+        """
+        executor = EnhancedThreadPoolExecutor(
+            name='TestRejectingExecutor',
+            max_workers=1)
+        serializer = Serializer(
+            name='TestRejectedSerializer',
+            executor=executor,
+        )
+        gate = threading.Event()
+        numbers = []
+        serializer.submit(gate.wait)
+        serializer.submit(_worker, numbers, 1)
+        serializer.submit(_worker, numbers, 2)
+        executor.shutdown(wait=False)
+        # The rejection is raised from the completion callback.
+        with loghandler('concurrent.futures'):
+            gate.set()
+            self.assertTrue(serializer._idle.wait(timeout=5.0))
+        self.assertEqual(numbers, [])
+        self.assertFalse(serializer._has_pending)
+        self.assertFalse(serializer._pending_operations)
+        serializer.shutdown()
+
     def tearDown(self):
         self.serializer.shutdown()
         del self.serializer
-        self.executor.shutdown()
-        del self.executor
 
 
 if __name__ == '__main__':
@@ -8,7 +8,7 @@
 import contextlib
 import logging
 import operator
-import time
+import threading
 import unittest
 
 from encore.concurrent.futures.serializing_asynchronizer import (
@@ -19,11 +19,13 @@ from encore.concurrent.futures.enhanced_thread_pool_executor import (
 
 class Worker(object):
 
-    def __init__(self):
+    def __init__(self, gate):
         self.data = []
+        self._gate = gate
 
     def __call__(self, value):
-        time.sleep(0.25)
+        # Hold the first job until all the others have been submitted.
+        self._gate.wait()
         self.data.append(value)
         return value
 
@@ -41,25 +43,26 @@ class TestHandler(logging.Handler):
         self.records.append(record)
 
 
+#: Name of the logger that reports failed jobs.
+_LOGGER_NAME = 'encore.concurrent.futures.abc_work_scheduler'
+
+
 @contextlib.contextmanager
 def loghandler(logger_name):
     """
     Log errors from a call and yield the handler.
 
+    The logger is expected to be configured by the test case already, see
+    `TestSerializingAsynchronizer.setUpClass`.
+
     """
     handler = TestHandler()
     logger = logging.getLogger(logger_name)
-    old_level = logger.level
-    logger.setLevel(logging.DEBUG)
-    old_propagate_value = logger.propagate
-    logger.propagate = False
     logger.addHandler(handler)
     try:
         yield handler
     finally:
         logger.removeHandler(handler)
-        logger.propagate = old_propagate_value
-        logger.setLevel(old_level)
 
 
 class TestException(Exception):
@@ -68,19 +71,39 @@ class TestException(Exception):
 
 class TestSerializingAsynchronizer(unittest.TestCase):
 
-    def setUp(self):
-        self.executor = EnhancedThreadPoolExecutor(
+    @classmethod
+    def setUpClass(cls):
+        # The executor is shared by all the tests, which only need it to
+        # run their jobs one at a time.
+        cls.executor = EnhancedThreadPoolExecutor(
             name='TestSerializingAsynchronizerExecutor',
             max_workers=1,
         )
+        # Capture the failure reports of the whole test case, so that the
+        # tests only need to swap handlers.
+        logger = logging.getLogger(_LOGGER_NAME)
+        cls._old_logger_state = logger.level, logger.propagate
+        logger.setLevel(logging.DEBUG)
+        logger.propagate = False
+
+    @classmethod
+    def tearDownClass(cls):
+        logger = logging.getLogger(_LOGGER_NAME)
+        level, logger.propagate = cls._old_logger_state
+        logger.setLevel(level)
+        cls.executor.shutdown()
+        del cls.executor
+
+    def setUp(self):
         self.asynchronizer = SerializingAsynchronizer(
             name='TestSerializingAsynchronizer',
             executor=self.executor,
         )
 
     def test_events_collapsed(self):
-        worker1 = Worker()
-        worker2 = Worker()
+        gate = threading.Event()
+        worker1 = Worker(gate)
+        worker2 = Worker(gate)
         self.asynchronizer.submit(worker1, 1)
         self.asynchronizer.submit(worker1, 2)
         self.asynchronizer.submit(worker1, 3)
@@ -103,6 +126,7 @@ class TestSerializingAsynchronizer(unittest.TestCase):
         self.asynchronizer.submit(worker2, 19)
         self.asynchronizer.submit(worker2, 20)
 
+        gate.set()
         self.asynchronizer.wait()
         self.assertEqual(len(worker1.data), 2)
         self.assertEqual(worker1.data[0], 1)
@@ -126,8 +150,9 @@ class TestSerializingAsynchronizer(unittest.TestCase):
             callback=_callback
         )
 
-        worker1 = Worker()
-        worker2 = Worker()
+        gate = threading.Event()
+        worker1 = Worker(gate)
+        worker2 = Worker(gate)
 
         asynchronizer.submit(worker1, 1)
         asynchronizer.submit(worker1, 2)
@@ -150,6 +175,7 @@ class TestSerializingAsynchronizer(unittest.TestCase):
         asynchronizer.submit(worker2, 18)
         asynchronizer.submit(worker2, 19)
         asynchronizer.submit(worker2, 20)
+        gate.set()
         asynchronizer.wait()
 
         self.assertEqual(len(worker1.data), 2)
@@ -184,8 +210,7 @@ class TestSerializingAsynchronizer(unittest.TestCase):
         but we should get a logged exception as a result.
 
         """
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             self.asynchronizer.submit(operator.floordiv, 1, 0)
             self.asynchronizer.wait()
 
@@ -216,8 +241,7 @@ class TestSerializingAsynchronizer(unittest.TestCase):
         )
 
         # Submit a bad job
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             asynchronizer.submit(operator.floordiv, 1, 0)
             asynchronizer.wait()
 
@@ -249,8 +273,7 @@ class TestSerializingAsynchronizer(unittest.TestCase):
         )
 
         # Submit a good job
-        logger_name = 'encore.concurrent.futures.abc_work_scheduler'
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             asynchronizer.submit(operator.add, 1, 0)
             asynchronizer.wait()
 
@@ -264,7 +287,7 @@ class TestSerializingAsynchronizer(unittest.TestCase):
         self.assertIs(exc_type, TestException)
 
         # Submit a bad job
-        with loghandler(logger_name) as handler:
+        with loghandler(_LOGGER_NAME) as handler:
             asynchronizer.submit(operator.floordiv, 1, 0)
             asynchronizer.wait()
 
@@ -282,8 +305,6 @@ class TestSerializingAsynchronizer(unittest.TestCase):
     def tearDown(self):
         self.asynchronizer.shutdown()
         del self.asynchronizer
-        self.executor.shutdown()
-        del self.executor
 
 
 if __name__ == '__main__':
@@ -22,11 +22,36 @@ class TestSynchronousExecutor(unittest.TestCase):
         future = self.executor.submit(mul, 2, y=8)
         self.assertEqual(16, future.result())
 
+    def test_submit_exception(self):
+        future = self.executor.submit(divmod, 1, 0)
+        self.assertTrue(future.done())
+        self.assertIsInstance(future.exception(), ZeroDivisionError)
+
     def test_map(self):
         self.assertEqual(
             list(self.executor.map(pow, range(10), range(10))),
             list(map(pow, range(10), range(10))))
 
+    def test_map_exception(self):
+        calls = []
+
+        def record_divmod(x, y):
+            calls.append(x)
+            return divmod(x, y)
+
+        i = self.executor.map(record_divmod, [1, 2, 3, 4], [2, 3, 0, 5])
+        # All the calls are made before the results are consumed.
+        self.assertEqual(calls, [1, 2, 3, 4])
+        self.assertEqual(next(i), (0, 1))
+        self.assertEqual(next(i), (0, 2))
+        with self.assertRaises(ZeroDivisionError):
+            next(i)
+
+    def test_map_after_shutdown(self):
+        self.executor.shutdown()
+        with self.assertRaises(RuntimeError):
+            self.executor.map(abs, range(-5, 5))
+
     def test_run_after_shutdown(self):
         self.executor.shutdown()
         with self.assertRaises(RuntimeError):
@@ -12,7 +12,8 @@ import time
 import unittest
 
 # local imports
-from encore.concurrent.threadtools import synchronized
+from encore.concurrent.threadtools import (
+    _stripe_index, synchronized, synchronized_per_instance)
 
 
 class SynchronizedTest(unittest.TestCase):
@@ -28,6 +29,13 @@ class SynchronizedTest(unittest.TestCase):
 
         self.assertEqual(result, 'test')
 
+    def test_synchronized_reentrant(self):
+        @synchronized(reentrant=True)
+        def countdown(n):
+            return countdown(n - 1) if n else 'done'
+
+        self.assertEqual(countdown(3), 'done')
+
     def test_two_threads(self):
         # test that we don't run at the same time
 
@@ -53,3 +61,67 @@ class SynchronizedTest(unittest.TestCase):
                                   'call finished on thread 1',
                                   'call started on thread 2',
                                   'call finished on thread 2'])
+
+
+class SynchronizedPerInstanceTest(unittest.TestCase):
+
+    def test_same_instance(self):
+        # test that calls on one instance don't run at the same time
+
+        result = []
+
+        class Worker(object):
+            @synchronized_per_instance
+            def work(self, thread):
+                result.append('call started on {}'.format(thread))
+                time.sleep(0.3)
+                result.append('call finished on {}'.format(thread))
+
+        worker = Worker()
+        thread1 = threading.Thread(target=lambda: worker.work("thread 1"))
+        thread2 = threading.Thread(target=lambda: worker.work("thread 2"))
+
+        thread1.start()
+        time.sleep(0.1)
+        thread2.start()
+
+        thread1.join()
+        thread2.join()
+
+        self.assertEqual(result, ['call started on thread 1',
+                                  'call finished on thread 1',
+                                  'call started on thread 2',
+                                  'call finished on thread 2'])
+
+    def test_different_instances(self):
+        # test that calls on instances with different locks run together
+
+        # Both calls must be running at once to pass the barrier.
+        barrier = threading.Barrier(2, timeout=5.0)
+
+        class Worker(object):
+            @synchronized_per_instance(stripes=2)
+            def work(self):
+                barrier.wait()
+
+        by_stripe = {}
+        workers = [Worker() for _ in range(16)]
+        for worker in workers:
+            by_stripe.setdefault(_stripe_index(worker, 2), worker)
+        self.assertEqual(len(by_stripe), 2)
+
+        threads = [threading.Thread(target=worker.work)
+                   for worker in by_stripe.values()]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertFalse(barrier.broken)
+
+    def test_reentrant(self):
+        class Counter(object):
+            @synchronized_per_instance
+            def countdown(self, n):
+                return self.countdown(n - 1) if n else 'done'
+
+        self.assertEqual(Counter().countdown(3), 'done')
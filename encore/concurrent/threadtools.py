@@ -8,22 +8,106 @@
 """Module of useful routines for working with concurrency."""
 
 from functools import wraps
-from threading import RLock
+from threading import Lock, RLock
 
 
-def synchronized(func):
+def synchronized(func=None, *, reentrant=False):
     """ Decorator that prevents simultaneous execution of a function
 
     This decorator that ensures that only one thread at a time can be executing
     the decorated function at the same time by using a dedicated anonymous
     lock.
 
+    Parameters
+    ----------
+    func : callable
+        The function to decorate.  If omitted, a decorator is returned, so
+        that the options can be given as ``@synchronized(reentrant=True)``.
+
+    reentrant : bool
+        Whether the decorated function may call itself, directly or
+        indirectly, from the thread already executing it.  By default a
+        plain, faster, non-reentrant lock is used, and such a call
+        deadlocks: recursive callers must pass ``reentrant=True``.  Earlier
+        versions always used a reentrant lock.
+
     """
-    lock = RLock()
+    if func is None:
+        def decorator(func):
+            return synchronized(func, reentrant=reentrant)
+        return decorator
+
+    lock = RLock() if reentrant else Lock()
+    # Calling the bound methods directly is noticeably cheaper than going
+    # through the context manager protocol of the lock.
+    acquire = lock.acquire
+    release = lock.release
 
     @wraps(func)
     def wrapper(*args, **kw):
-        with lock:
+        acquire()
+        try:
             return func(*args, **kw)
+        finally:
+            release()
 
     return wrapper
+
+
+def synchronized_per_instance(func=None, *, stripes=16):
+    """ Decorator that prevents simultaneous execution of a method on an
+    instance
+
+    Calls on the same instance are serialized, but calls on different
+    instances usually run concurrently.  Rather than creating a lock per
+    instance, the decorator keeps a fixed table of reentrant locks and picks
+    one from the identity of the instance.
+
+    Parameters
+    ----------
+    func : callable
+        The method to decorate.  If omitted, a decorator is returned, so
+        that the options can be given as
+        ``@synchronized_per_instance(stripes=64)``.
+
+    stripes : int
+        The number of locks in the table.  Distinct instances may share a
+        lock, in which case their calls are serialized as well; a larger
+        table makes this less likely.
+
+    Note
+    ----
+
+    Because unrelated instances can share a lock, a method that calls into
+    another instance while another thread does the reverse can deadlock even
+    if the two instances would never deadlock with locks of their own.
+
+    """
+    if func is None:
+        def decorator(func):
+            return synchronized_per_instance(func, stripes=stripes)
+        return decorator
+
+    locks = [RLock() for _ in range(stripes)]
+
+    @wraps(func)
+    def wrapper(self, *args, **kw):
+        lock = locks[_stripe_index(self, stripes)]
+        lock.acquire()
+        try:
+            return func(self, *args, **kw)
+        finally:
+            lock.release()
+
+    return wrapper
+
+
+def _stripe_index(obj, stripes):
+    """ Map an object to one of `stripes` lock indices by its identity.
+
+    """
+    # Objects are aligned in memory and allocated at regular strides, so the
+    # bits of their ids are scrambled with a multiplicative hash, and the
+    # well mixed high bits select the index.
+    mixed = ((id(obj) >> 4) * 2654435761) & 0xFFFFFFFF
+    return (mixed * stripes) >> 32
@@ -33,17 +33,37 @@ class BaseEvent(object):
         Additional Event attributes which will be added to the Event object.
 
     """
+    # The source and the handled flag are set on every event, and the flag is
+    # read after every listener call, so they are kept in slots rather than
+    # in the instance dictionary.
+    __slots__ = ('source', '_handled', '__dict__', '__weakref__')
 
     def __init__(self, source=None, **kwargs):
         # The source of the event.
-        kwargs['source'] = [] if source is None else source
-        self.__dict__.update(**kwargs)
+        self.source = [] if source is None else source
 
         # Whether the event has been handled by a listener.
         self._handled = False
 
+        if kwargs:
+            self.__dict__.update(kwargs)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['source'] = self.source
+        state['_handled'] = self._handled
+        return state
+
+    def __setstate__(self, state):
+        state = state.copy()
+        self.source = state.pop('source', [])
+        self._handled = state.pop('_handled', False)
+        self.__dict__.update(state)
+
     def mark_as_handled(self):
         """ Mark the event as handled so subsequent listeners are not notified.
+
+        Marking is a single attribute store, so no lock is needed.
         """
         self._handled = True
 
@@ -138,9 +158,11 @@ class BaseEventManager(object):
             The :py:class:`BaseEvent` instance to emit.
         block : bool
             Whether to block the call until the event handling is finished.
-            If block is False, the event will be emitted in a separate thread
-            and the thread will be returned, so you can later query its status
-            or do ``wait()`` on the thread.
+            If block is True, the listeners are called directly on the
+            calling thread, without starting any thread. If block is False,
+            the event will be emitted in a separate thread and the thread
+            will be returned, so you can later query its status or do
+            ``wait()`` on the thread.
 
         Note
         ----
@@ -15,6 +15,7 @@ import logging
 import itertools
 import bisect
 import heapq
+import operator
 import threading
 import weakref
 from types import MethodType
@@ -107,7 +108,13 @@ class EventInfo(object):
         """
         self.cls = cls
         self._priority_list = [] # sorted priority list
+        # Immutable copy of the sorted priority list, replaced on every
+        # change, so that it can be handed out without copying.
+        self._listeners = ()
         self._priority_info = {}
+        # Maps listener ids to their filters, as tuples of
+        # (attribute getter, value) pairs. Like the listener snapshot, the
+        # dictionary is replaced rather than modified.
         self._listener_filters = {}
         self._filter_keys = set() # to precompute filters on event emit
         self._disable = False
@@ -169,12 +176,18 @@ class EventInfo(object):
         with self._priority_list_lock:
             sub = self._get_notifier(func, self._listener_deleted)
             if filter:
-                self._listener_filters[id] = filter
+                # The getters walk the extended attribute names in C.
+                l_filter = dict(self._listener_filters)
+                l_filter[id] = tuple(
+                    (operator.attrgetter(key), value)
+                    for key, value in filter.items())
+                self._listener_filters = l_filter
                 for key in filter:
                     self._filter_keys.add(key)
             key = (-priority, count, sub)
             bisect.insort_left(self._priority_list, key)
             self._priority_info[id] = key
+            self._listeners = tuple(self._priority_list)
 
     def disconnect(self, func):
         """ Disconnects a listener from being notified about the event'
@@ -197,8 +210,11 @@ class EventInfo(object):
             idx = bisect.bisect_left(self._priority_list, key)
             del self._priority_info[id]
             del self._priority_list[idx]
+            self._listeners = tuple(self._priority_list)
             if id in self._listener_filters:
-                del self._listener_filters[id]
+                l_filter = dict(self._listener_filters)
+                del l_filter[id]
+                self._listener_filters = l_filter
 
     def get_id(self, func):
         """ Get an id as unique key for the function. """
@@ -232,33 +248,36 @@ class EventInfo(object):
         If ``event`` is None, all listeners are returned.
         If ``event`` is an event, only listeners which will be called for the
         event are returned (satisfying any filters on the listeners).
+
+        The filters are evaluated on a snapshot of the listeners, without
+        holding the lock, so a listener disconnected meanwhile may still be
+        returned once.
         """
+        if event is None or not self._listener_filters:
+            return self._listeners
         with self._priority_list_lock:
-            if event is None or not self._listener_filters:
-                return self._priority_list[:]
-            ret = []
+            listeners = self._listeners
             l_filter = self._listener_filters
-            for linfo in self._priority_list:
-                listener = linfo[-1]
-                id = self.get_id(listener())
-                if id in l_filter:
-                    for key, value in l_filter[id].items():
-                        attr = event
-                        try:
-                            # Get extended attributes of the event.
-                            for part in key.split('.'):
-                                attr = getattr(attr, part)
-                        except AttributeError as e:
-                            logger.info('Error filtering listener: %s; %s',
-                                        linfo, e)
-                            break
-                        if attr != value:
-                            break
-                    else:
-                        ret.append(linfo)
+        ret = []
+        for linfo in listeners:
+            listener = linfo[-1]
+            id = self.get_id(listener())
+            if id in l_filter:
+                for getter, value in l_filter[id]:
+                    try:
+                        # Get extended attributes of the event.
+                        attr = getter(event)
+                    except AttributeError as e:
+                        logger.info('Error filtering listener: %s; %s',
+                                    linfo, e)
+                        break
+                    if attr != value:
+                        break
                 else:
                     ret.append(linfo)
-            return ret
+            else:
+                ret.append(linfo)
+        return ret
 
     def disable(self):
         """ Disable the event from generating notifications.
@@ -290,6 +309,9 @@ class EventManager(BaseEventManager):
         self.event_map = {}
         self.count = itertools.count()
         self._trace_func = None
+        # Maps event classes to the listener snapshots of their hierarchy
+        # and the merged listeners built from them.
+        self._listener_cache = {}
 
     ###########################################################################
     # `EventManager` Interface
@@ -355,6 +377,7 @@ class EventManager(BaseEventManager):
         if cls not in self.event_map:
             self.register(cls)
         self.event_map[cls].connect(func, filter, priority, next(self.count))
+        self._listener_cache.clear()
 
     def disconnect(self, cls, func):
         """ Disconnects a listener from being notified about the event'
@@ -377,6 +400,7 @@ class EventManager(BaseEventManager):
                                 (cls, func)):
                 return
         self.event_map[cls].disconnect(func)
+        self._listener_cache.clear()
 
     def emit(self, event, block=True):
         """ Notifies all listeners about the event with the specified arguments.
@@ -387,9 +411,11 @@ class EventManager(BaseEventManager):
             The :py:class:`BaseEvent` instance to emit.
         block : bool
             Whether to block the call until the event handling is finished.
-            If block is False, the event will be emitted in a separate thread
-            and the thread will be returned, so you can later query its status
-            or do ``wait()`` on the thread.
+            If block is True, the listeners are called directly on the
+            calling thread, without starting any thread. If block is False,
+            the event will be emitted in a separate thread and the thread
+            will be returned, so you can later query its status or do
+            ``wait()`` on the thread.
 
         Note
         ----
@@ -487,9 +513,22 @@ class EventManager(BaseEventManager):
             else:
                 cls = event
                 event = None
-        classes = self.get_event_hierarchy(cls)
-        listeners = heapq.merge(*[evt_map[cls].get_listeners(event)
-                                    for cls in classes if cls in evt_map])
+        infos = [evt_map[c] for c in self.get_event_hierarchy(cls)
+                 if c in evt_map]
+        if event is not None and any(info._listener_filters
+                                     for info in infos):
+            listeners = heapq.merge(*[info.get_listeners(event)
+                                      for info in infos])
+        else:
+            # Merge the listeners of the hierarchy only when one of them
+            # changed; listeners of collected methods disconnect themselves
+            # without going through the manager.
+            snapshots = tuple(info._listeners for info in infos)
+            cached = self._listener_cache.get(cls)
+            if cached is None or cached[0] != snapshots:
+                cached = snapshots, tuple(heapq.merge(*snapshots))
+                self._listener_cache[cls] = cached
+            listeners = cached[1]
         listeners = (l[-1]() for l in listeners)
         return listeners
 
@@ -6,6 +6,7 @@
 #
 
 # Standard library imports.
+import pickle
 import unittest
 import unittest.mock as mock
 import weakref
@@ -212,6 +213,18 @@ class TestEventManager(unittest.TestCase):
         self.assertEqual(callback2.call_count, 1)
         self.assertEqual(callback2.call_args, ((evt1,), {}))
 
+    def test_event_pickle(self):
+        """ Test that events keep their attributes through pickling.
+        """
+        evt = BaseEvent(source='source', value=42)
+        evt.mark_as_handled()
+        for protocol in range(pickle.HIGHEST_PROTOCOL + 1):
+            with self.subTest(protocol=protocol):
+                copied = pickle.loads(pickle.dumps(evt, protocol))
+                self.assertEqual(copied.source, 'source')
+                self.assertEqual(copied.value, 42)
+                self.assertTrue(copied._handled)
+
     def test_filtering(self):
         """ Test if event filtering on arguments works.
         """
@@ -422,6 +435,28 @@ class TestEventManager(unittest.TestCase):
         self.evt_mgr.emit(BaseEvent())
         self.assertEqual(data, [0, 1, 2, 3])
 
+    def test_reentrant_filter_connect(self):
+        """ Test a filtered attribute may connect listeners while filtering.
+        """
+        callback = mock.Mock()
+        callback2 = mock.Mock()
+        evt_mgr = self.evt_mgr
+
+        class MyEvt(BaseEvent):
+            @property
+            def name(self):
+                evt_mgr.connect(MyEvt, callback2)
+                return 'name'
+
+        self.evt_mgr.connect(MyEvt, callback, filter={'name': 'name'})
+
+        thread = threading.Thread(target=self.evt_mgr.emit, args=(MyEvt(),))
+        thread.daemon = True
+        thread.start()
+        thread.join(timeout=5.0)
+        self.assertFalse(thread.is_alive())
+        self.assertEqual(callback.call_count, 1)
+
     def test_lambda_connect(self):
         """ Test if lambda functions w/o references are not garbage collected.
         """
@@ -485,6 +520,28 @@ class TestEventManager(unittest.TestCase):
         self.assertEqual(data, [])
         self.assertEqual(len(list(self.evt_mgr.get_listeners(BaseEvent))), 0)
 
+    def test_method_collect_after_emit(self):
+        """ Test if collecting a listener method updates emitted listeners.
+        """
+        data = []
+        class MyHeavyObject(object):
+            def callback(self, evt):
+                data.append(1)
+        class MyEvt(BaseEvent):
+            pass
+        obj = MyHeavyObject()
+        callback = mock.Mock()
+        self.evt_mgr.connect(BaseEvent, callback)
+        self.evt_mgr.connect(MyEvt, obj.callback)
+        self.evt_mgr.emit(MyEvt())
+        self.assertEqual(data, [1])
+
+        del obj
+        self.evt_mgr.emit(MyEvt())
+        self.assertEqual(data, [1])
+        self.assertEqual(callback.call_count, 2)
+        self.assertEqual(list(self.evt_mgr.get_listeners(MyEvt)), [callback])
+
     def test_method_disconnect(self):
         """ Test if method disconnect works.
         """